@@ -4,8 +4,10 @@ Create Deep Multi-Hop Relationships in Mem0
 Uses OrchestKit agents and skills to build comprehensive relationship chains
 """
 import json
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add mem0 scripts to path
@@ -20,6 +22,15 @@ from mem0_client import get_mem0_client  # type: ignore  # noqa: E402
 
 USER_ID = "orchestkit:all-agents"
 
+# Snapshot the skills directory once at import time. A single getdents pass
+# replaces the two stat() calls get_skill_category would otherwise make per
+# (agent, skill) pair.
+try:
+    _SKILL_NAMES = {e.name for e in os.scandir(SKILLS_DIR) if e.is_dir(follow_symlinks=False)}
+except OSError:
+    _SKILL_NAMES = set()
+_SKILL_MD_PRESENT = {n for n in _SKILL_NAMES if (SKILLS_DIR / n / "SKILL.md").is_file()}
+
 def extract_agent_skills(agent_file: Path) -> list[str]:
     """Extract skills list from agent markdown file."""
     content = agent_file.read_text()
@@ -39,15 +50,11 @@ def extract_agent_skills(agent_file: Path) -> list[str]:
     
     return skills
 
+@lru_cache(maxsize=None)
 def get_skill_category(skill_name: str) -> str:
     """Determine skill category from skill name and directory."""
-    skill_dir = SKILLS_DIR / skill_name
-    if not skill_dir.exists():
-        return "Unknown"
-    
-    skill_md = skill_dir / "SKILL.md"
-    if skill_md.exists():
-        content = skill_md.read_text()
+    if skill_name in _SKILL_MD_PRESENT:
+        content = (SKILLS_DIR / skill_name / "SKILL.md").read_text()
         # Try to extract category from tags or description
         if 'tags:' in content:
             tags_match = re.search(r'tags:\s*\[(.*?)\]', content)
@@ -357,10 +364,27 @@ def create_all_skill_technology_relationships(client):
     return created_count
 
 
+# Shared text/metadata shape for technology dependency memories, hoisted so the
+# loop below only fills in the varying fields.
+_TECHDEP_TEMPLATE = (
+    "{f} technology {r} {t} technology. "
+    "{f} depends on {t} for core functionality. "
+    "Both {f} and {t} are core technologies in OrchestKit plugin patterns."
+)
+_TECHDEP_PROTO = {
+    "type": "relationship",
+    "entity_type": "Technology",
+    "color_group": "technology",
+    "category": "technologies",
+    "plugin_component": True,
+    "hop": 1,
+}
+
+
 def create_technology_dependencies(client):
     """Create technology-to-technology dependency relationships."""
     print("\n=== Phase 3: Creating Technology Dependencies ===\n")
-    
+
     # Technology dependency mappings
     dependencies = [
         ("pgvector", "PostgreSQL", "extends"),
@@ -378,24 +402,9 @@ def create_technology_dependencies(client):
     
     created_count = 0
     for tech_from, tech_to, rel_type in dependencies:
-        text = (
-            f"{tech_from} technology {rel_type} {tech_to} technology. "
-            f"{tech_from} depends on {tech_to} for core functionality. "
-            f"Both {tech_from} and {tech_to} are core technologies in OrchestKit plugin patterns."
-        )
-        
-        metadata = {
-            "type": "relationship",
-            "entity_type": "Technology",
-            "color_group": "technology",
-            "category": "technologies",
-            "plugin_component": True,
-            "from": tech_from,
-            "to": tech_to,
-            "relation": rel_type,
-            "hop": 1
-        }
-        
+        text = _TECHDEP_TEMPLATE.format_map({"f": tech_from, "t": tech_to, "r": rel_type})
+        metadata = {**_TECHDEP_PROTO, "from": tech_from, "to": tech_to, "relation": rel_type}
+
         try:
             client.add(
                 messages=[{"role": "user", "content": text}],
@@ -3,181 +3,230 @@
 Create comprehensive technology memories for OrchestKit plugin.
 Creates memories for all key technologies used in the plugin.
 """
+import asyncio
+import fcntl
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 # Add mem0 scripts to path
-SCRIPT_DIR = Path(__file__).parent
-PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent.parent
-
-sys.path.insert(0, str(SCRIPT_DIR.parent / "lib"))
-from mem0_client import get_mem0_client  # type: ignore  # noqa: E402
+_SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(_SCRIPT_DIR.parent / "lib"))
+from mem0_client import get_async_mem0_client  # type: ignore  # noqa: E402
 
 USER_ID = "orchestkit:all-agents"
 
+# Cap in-flight requests against the mem0 rate limit
+MAX_CONCURRENT_ADDS = 8
+
+# On-disk cache of known technology names, so --skip-existing doesn't pay a
+# 1000-row search on every invocation
+TECH_CACHE_PATH = Path.home() / ".cache" / "skillforge" / "mem0" / "tech-names.json"
+TECH_CACHE_TTL_SECONDS = 3600
+
+
+def _load_tech_cache(path: Path) -> set[str] | None:
+    """Load cached technology names if the cache file is fresh enough."""
+    import json
+    import time
+
+    try:
+        with path.open() as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - data.get("ts", 0) > TECH_CACHE_TTL_SECONDS:
+        return None
+    return set(data.get("names", []))
+
+
+def _save_tech_cache(path: Path, names: set[str]) -> None:
+    """Persist technology names with a timestamp; best-effort only."""
+    import json
+    import time
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            json.dump({"names": sorted(names), "ts": time.time()}, f)
+    except OSError:
+        pass
+
+
+@dataclass(frozen=True, slots=True)
+class Technology:
+    """One technology definition; slots keep the 24-entry table compact."""
+    name: str
+    description: str
+    version: str = ""
+    category: str = "Technology"
+
 
 # Technology definitions with descriptions
-TECHNOLOGIES = [
-    {
-        "name": "FastAPI",
-        "description": "Modern, fast web framework for building APIs with Python 3.11+. Used extensively in OrchestKit plugin patterns for async Python backends.",
-        "version": "0.115.0+",
-        "category": "Backend Framework"
-    },
-    {
-        "name": "React 19",
-        "description": "Frontend framework with Server Components, concurrent features, and React Compiler. Core technology for frontend skills in OrchestKit.",
-        "version": "19.0.0+",
-        "category": "Frontend Framework"
-    },
-    {
-        "name": "LangGraph",
-        "description": "Agent orchestration framework for building multi-agent workflows. Used in AI/LLM skills for agent patterns and state management.",
-        "version": "1.0.0+",
-        "category": "AI/ML Framework"
-    },
-    {
-        "name": "PostgreSQL",
-        "description": "Advanced open-source relational database. Used with pgvector extension for hybrid search in RAG applications.",
-        "version": "18.0+",
-        "category": "Database"
-    },
-    {
-        "name": "pgvector",
-        "description": "PostgreSQL extension for vector similarity search. Enables hybrid BM25 + vector search with HNSW indexing.",
-        "version": "0.7.0+",
-        "category": "Database Extension"
-    },
-    {
-        "name": "TypeScript",
-        "description": "Typed superset of JavaScript. Used throughout frontend skills for type safety and better developer experience.",
-        "version": "5.7+",
-        "category": "Language"
-    },
-    {
-        "name": "Python",
-        "description": "Python programming language. OrchestKit requires Python 3.11+ for modern async features and type hints.",
-        "version": "3.11+",
-        "category": "Language"
-    },
-    {
-        "name": "Claude Code",
-        "description": "Claude Code IDE and plugin system. OrchestKit requires CC 2.1.11+ for Setup hooks, native parallel execution, and agent features.",
-        "version": "2.1.11+",
-        "category": "IDE/Platform"
-    },
-    {
-        "name": "TanStack Query",
-        "description": "Powerful data synchronization library for React. Used in frontend skills for server state management, caching, and optimistic updates.",
-        "version": "5.0+",
-        "category": "Frontend Library"
-    },
-    {
-        "name": "Zustand",
-        "description": "Lightweight state management library for React. Used in frontend skills for client-side state with minimal boilerplate.",
-        "version": "5.0+",
-        "category": "Frontend Library"
-    },
-    {
-        "name": "Zod",
-        "description": "TypeScript-first schema validation library. Used for runtime type checking and validation in frontend and API patterns.",
-        "version": "3.23.0+",
-        "category": "Validation Library"
-    },
-    {
-        "name": "Pydantic",
-        "description": "Data validation library for Python using type annotations. Used in FastAPI for request/response validation.",
-        "version": "2.9+",
-        "category": "Validation Library"
-    },
-    {
-        "name": "Playwright",
-        "description": "End-to-end testing framework for web applications. Used in E2E testing skills for browser automation.",
-        "version": "1.57+",
-        "category": "Testing Framework"
-    },
-    {
-        "name": "pytest",
-        "description": "Testing framework for Python. Used in backend testing skills with async support and fixtures.",
-        "version": "8.0+",
-        "category": "Testing Framework"
-    },
-    {
-        "name": "MSW",
-        "description": "Mock Service Worker for API mocking in tests. Used in frontend testing skills for deterministic API responses.",
-        "version": "2.0+",
-        "category": "Testing Library"
-    },
-    {
-        "name": "Redis",
-        "description": "In-memory data structure store. Used for caching, session storage, and distributed locking patterns.",
-        "version": "7.0+",
-        "category": "Cache/Store"
-    },
-    {
-        "name": "Celery",
-        "description": "Distributed task queue for Python. Used in background job skills for async task processing.",
-        "version": "5.4+",
-        "category": "Task Queue"
-    },
-    {
-        "name": "RabbitMQ",
-        "description": "Message broker for message queue patterns. Used in event-driven architecture skills.",
-        "version": "3.13+",
-        "category": "Message Broker"
-    },
-    {
-        "name": "Docker",
-        "description": "Containerization platform. Used in DevOps skills for containerizing applications and services.",
-        "version": "Latest",
-        "category": "Containerization"
-    },
-    {
-        "name": "GitHub Actions",
-        "description": "CI/CD platform integrated with GitHub. Used in DevOps skills for automated workflows and deployments.",
-        "version": "Latest",
-        "category": "CI/CD"
-    },
-    {
-        "name": "SQLAlchemy",
-        "description": "Python SQL toolkit and ORM. OrchestKit uses SQLAlchemy 2.0+ with async support for database operations.",
-        "version": "2.0+",
-        "category": "ORM"
-    },
-    {
-        "name": "Alembic",
-        "description": "Database migration tool for SQLAlchemy. Used in database skills for schema versioning and migrations.",
-        "version": "1.13+",
-        "category": "Migration Tool"
-    },
-    {
-        "name": "Vite",
-        "description": "Next-generation frontend build tool. Used in frontend skills for fast development and optimized production builds.",
-        "version": "7.0+",
-        "category": "Build Tool"
-    },
-    {
-        "name": "Biome",
-        "description": "Fast formatter and linter for JavaScript/TypeScript. Used in frontend skills as unified replacement for ESLint/Prettier.",
-        "version": "2.0+",
-        "category": "Linting Tool"
-    }
-]
+TECHNOLOGIES = (
+    Technology(
+        name="FastAPI",
+        description="Modern, fast web framework for building APIs with Python 3.11+. Used extensively in OrchestKit plugin patterns for async Python backends.",
+        version="0.115.0+",
+        category="Backend Framework"
+    ),
+    Technology(
+        name="React 19",
+        description="Frontend framework with Server Components, concurrent features, and React Compiler. Core technology for frontend skills in OrchestKit.",
+        version="19.0.0+",
+        category="Frontend Framework"
+    ),
+    Technology(
+        name="LangGraph",
+        description="Agent orchestration framework for building multi-agent workflows. Used in AI/LLM skills for agent patterns and state management.",
+        version="1.0.0+",
+        category="AI/ML Framework"
+    ),
+    Technology(
+        name="PostgreSQL",
+        description="Advanced open-source relational database. Used with pgvector extension for hybrid search in RAG applications.",
+        version="18.0+",
+        category="Database"
+    ),
+    Technology(
+        name="pgvector",
+        description="PostgreSQL extension for vector similarity search. Enables hybrid BM25 + vector search with HNSW indexing.",
+        version="0.7.0+",
+        category="Database Extension"
+    ),
+    Technology(
+        name="TypeScript",
+        description="Typed superset of JavaScript. Used throughout frontend skills for type safety and better developer experience.",
+        version="5.7+",
+        category="Language"
+    ),
+    Technology(
+        name="Python",
+        description="Python programming language. OrchestKit requires Python 3.11+ for modern async features and type hints.",
+        version="3.11+",
+        category="Language"
+    ),
+    Technology(
+        name="Claude Code",
+        description="Claude Code IDE and plugin system. OrchestKit requires CC 2.1.11+ for Setup hooks, native parallel execution, and agent features.",
+        version="2.1.11+",
+        category="IDE/Platform"
+    ),
+    Technology(
+        name="TanStack Query",
+        description="Powerful data synchronization library for React. Used in frontend skills for server state management, caching, and optimistic updates.",
+        version="5.0+",
+        category="Frontend Library"
+    ),
+    Technology(
+        name="Zustand",
+        description="Lightweight state management library for React. Used in frontend skills for client-side state with minimal boilerplate.",
+        version="5.0+",
+        category="Frontend Library"
+    ),
+    Technology(
+        name="Zod",
+        description="TypeScript-first schema validation library. Used for runtime type checking and validation in frontend and API patterns.",
+        version="3.23.0+",
+        category="Validation Library"
+    ),
+    Technology(
+        name="Pydantic",
+        description="Data validation library for Python using type annotations. Used in FastAPI for request/response validation.",
+        version="2.9+",
+        category="Validation Library"
+    ),
+    Technology(
+        name="Playwright",
+        description="End-to-end testing framework for web applications. Used in E2E testing skills for browser automation.",
+        version="1.57+",
+        category="Testing Framework"
+    ),
+    Technology(
+        name="pytest",
+        description="Testing framework for Python. Used in backend testing skills with async support and fixtures.",
+        version="8.0+",
+        category="Testing Framework"
+    ),
+    Technology(
+        name="MSW",
+        description="Mock Service Worker for API mocking in tests. Used in frontend testing skills for deterministic API responses.",
+        version="2.0+",
+        category="Testing Library"
+    ),
+    Technology(
+        name="Redis",
+        description="In-memory data structure store. Used for caching, session storage, and distributed locking patterns.",
+        version="7.0+",
+        category="Cache/Store"
+    ),
+    Technology(
+        name="Celery",
+        description="Distributed task queue for Python. Used in background job skills for async task processing.",
+        version="5.4+",
+        category="Task Queue"
+    ),
+    Technology(
+        name="RabbitMQ",
+        description="Message broker for message queue patterns. Used in event-driven architecture skills.",
+        version="3.13+",
+        category="Message Broker"
+    ),
+    Technology(
+        name="Docker",
+        description="Containerization platform. Used in DevOps skills for containerizing applications and services.",
+        version="Latest",
+        category="Containerization"
+    ),
+    Technology(
+        name="GitHub Actions",
+        description="CI/CD platform integrated with GitHub. Used in DevOps skills for automated workflows and deployments.",
+        version="Latest",
+        category="CI/CD"
+    ),
+    Technology(
+        name="SQLAlchemy",
+        description="Python SQL toolkit and ORM. OrchestKit uses SQLAlchemy 2.0+ with async support for database operations.",
+        version="2.0+",
+        category="ORM"
+    ),
+    Technology(
+        name="Alembic",
+        description="Database migration tool for SQLAlchemy. Used in database skills for schema versioning and migrations.",
+        version="1.13+",
+        category="Migration Tool"
+    ),
+    Technology(
+        name="Vite",
+        description="Next-generation frontend build tool. Used in frontend skills for fast development and optimized production builds.",
+        version="7.0+",
+        category="Build Tool"
+    ),
+    Technology(
+        name="Biome",
+        description="Fast formatter and linter for JavaScript/TypeScript. Used in frontend skills as unified replacement for ESLint/Prettier.",
+        version="2.0+",
+        category="Linting Tool"
+    ),
+)
 
 
-def create_technology_memory(client, tech: Dict[str, Any]) -> bool:
-    """Create a memory for a technology."""
-    name = tech["name"]
-    description = tech["description"]
-    version = tech.get("version", "")
-    category = tech.get("category", "Technology")
-    
+def build_memory_payload(tech: Technology) -> tuple[str, dict]:
+    """Build the memory text and metadata for a technology."""
+    name = tech.name
+    description = tech.description
+    version = tech.version
+    category = tech.category
+
     # Build memory text
     text = f"{name} technology: {description}"
     if version:
         text += f" Version {version}."
     text += f" {name} is a core technology used in OrchestKit plugin patterns."
-    
+
     # Build metadata
     metadata = {
         "type": "technology",
@@ -190,14 +239,27 @@ def create_technology_memory(client, tech: Dict[str, Any]) -> bool:
         "tech_category": category,
         "shared": True  # Technologies are shared knowledge across agents
     }
-    
+    return text, metadata
+
+
+# Pre-build every (text, metadata) pair once at import; the create loop and
+# batch_add consume these directly instead of re-rendering per call
+TECH_PAYLOADS = tuple(build_memory_payload(tech) for tech in TECHNOLOGIES)
+
+
+async def create_technology_memory(client, tech: Technology, text: str, metadata: dict, semaphore: asyncio.Semaphore) -> bool:
+    """Create a memory for a technology from its prebuilt payload."""
+    name = tech.name
+    version = tech.version
+
     try:
-        result = client.add(
-            messages=[{"role": "user", "content": text}],
-            user_id=USER_ID,
-            metadata=metadata,
-            enable_graph=True
-        )
+        async with semaphore:
+            await client.add(
+                messages=[{"role": "user", "content": text}],
+                user_id=USER_ID,
+                metadata=metadata,
+                enable_graph=True
+            )
         print(f"  ✓ Created: {name} ({version})")
         return True
     except Exception as e:
@@ -205,7 +267,7 @@ def create_technology_memory(client, tech: Dict[str, Any]) -> bool:
         return False
 
 
-def main():
+async def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Create Mem0 memories for technologies")
@@ -214,8 +276,8 @@ def main():
     args = parser.parse_args()
     
     try:
-        client = get_mem0_client()
-        
+        client = get_async_mem0_client()
+
         print(f"Creating memories for {len(TECHNOLOGIES)} technologies\n")
         
         if args.dry_run:
@@ -224,39 +286,120 @@ def main():
         # Check existing memories if skip-existing
         existing_techs = set()
         if args.skip_existing:
-            print("Checking for existing technology memories...")
-            try:
-                result = client.search(
-                    query="technology core technology",
-                    filters={"user_id": USER_ID, "metadata.entity_type": "Technology"},
-                    limit=1000
-                )
-                for memory in result.get("results", []):
-                    metadata = memory.get("metadata", {})
-                    if "name" in metadata:
-                        existing_techs.add(metadata["name"])
-                print(f"Found {len(existing_techs)} existing technology memories\n")
-            except Exception as e:
-                print(f"Warning: Could not check existing memories: {e}\n")
+            cached = _load_tech_cache(TECH_CACHE_PATH)
+            if cached is not None:
+                existing_techs = cached
+                print(f"Found {len(existing_techs)} existing technology memories (cached)\n")
+            else:
+                print("Checking for existing technology memories...")
+                tech_filters = {"user_id": USER_ID, "metadata.entity_type": "Technology"}
+                try:
+                    try:
+                        # Plain list endpoint: no vector ranking server-side,
+                        # just paged metadata retrieval
+                        page = 1
+                        while True:
+                            batch = await client.get_all(
+                                filters=tech_filters,
+                                page=page,
+                                page_size=500
+                            )
+                            memories = batch.get("results", []) if isinstance(batch, dict) else batch
+                            for memory in memories:
+                                metadata = memory.get("metadata", {})
+                                if "name" in metadata:
+                                    existing_techs.add(metadata["name"])
+                            if not isinstance(batch, dict) or not batch.get("next"):
+                                break
+                            page += 1
+                    except (AttributeError, TypeError):
+                        # Older SDKs without get_all pagination: one wide search
+                        result = await client.search(
+                            query="technology core technology",
+                            filters=tech_filters,
+                            limit=1000
+                        )
+                        for memory in result.get("results", []):
+                            metadata = memory.get("metadata", {})
+                            if "name" in metadata:
+                                existing_techs.add(metadata["name"])
+                    print(f"Found {len(existing_techs)} existing technology memories\n")
+                    _save_tech_cache(TECH_CACHE_PATH, existing_techs)
+                except Exception as e:
+                    print(f"Warning: Could not check existing memories: {e}\n")
         
         created_count = 0
         skipped_count = 0
         failed_count = 0
-        
-        for tech in TECHNOLOGIES:
-            if args.skip_existing and tech["name"] in existing_techs:
-                print(f"  ⊘ Skipped (exists): {tech['name']}")
+        created_names: set[str] = set()
+
+        # Filter before building the batch so skipped techs never hit the API
+        pending = []
+        for tech, (text, metadata) in zip(TECHNOLOGIES, TECH_PAYLOADS):
+            if args.skip_existing and tech.name in existing_techs:
+                print(f"  ⊘ Skipped (exists): {tech.name}")
                 skipped_count += 1
-                continue
-            
-            if args.dry_run:
-                print(f"  [DRY RUN] Would create: {tech['name']} ({tech.get('version', 'N/A')})")
+            else:
+                pending.append((tech, text, metadata))
+
+        if args.dry_run:
+            for tech, _, _ in pending:
+                print(f"  [DRY RUN] Would create: {tech.name} ({tech.version or 'N/A'})")
                 created_count += 1
+        elif hasattr(client, "batch_add"):
+            # One batched dispatch instead of N sequential round-trips; mem0
+            # parallelizes items internally and reports per-item status.
+            batch_data = [
+                {
+                    "messages": [{"role": "user", "content": text}],
+                    "metadata": metadata,
+                    "infer": True,
+                    "enable_graph": True
+                }
+                for _, text, metadata in pending
+            ]
+            try:
+                results = await client.batch_add(batch_data, user_id=USER_ID)
+            except Exception as e:
+                print(f"Batch add failed: {e}", file=sys.stderr)
+                failed_count = len(pending)
             else:
-                if create_technology_memory(client, tech):
+                items = results.get("results", results) if isinstance(results, dict) else results
+                # Indexed walk rather than zip: a short results list means
+                # the trailing items were dropped server-side, and they
+                # must be counted as failures, not silently ignored
+                for idx, (tech, _, _) in enumerate(pending):
+                    item = items[idx] if idx < len(items) else None
+                    if item is None:
+                        print(f"  ✗ Failed: {tech.name}: no result returned", file=sys.stderr)
+                        failed_count += 1
+                        continue
+                    status = item.get("status", "ok") if isinstance(item, dict) else "ok"
+                    if status in ("error", "failed"):
+                        print(f"  ✗ Failed: {tech.name}: {item.get('error', 'unknown error')}", file=sys.stderr)
+                        failed_count += 1
+                    else:
+                        print(f"  ✓ Created: {tech.name} ({tech.version})")
+                        created_count += 1
+                        created_names.add(tech.name)
+        else:
+            # Older clients without batch_add: dispatch individual adds
+            # concurrently, capped by a semaphore against the rate limit
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ADDS)
+            outcomes = await asyncio.gather(
+                *(create_technology_memory(client, tech, text, metadata, semaphore)
+                  for tech, text, metadata in pending),
+                return_exceptions=True
+            )
+            for (tech, _, _), outcome in zip(pending, outcomes):
+                if outcome is True:
                     created_count += 1
+                    created_names.add(tech.name)
                 else:
                     failed_count += 1
+
+        if created_names:
+            _save_tech_cache(TECH_CACHE_PATH, existing_techs | created_names)
         
         print(f"\n=== Summary ===")
         print(f"Created: {created_count}")
@@ -270,11 +413,11 @@ def main():
             print("\n✓ Technology memories creation complete!")
         
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        sys.stderr.write(f"Error: {e}\n")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
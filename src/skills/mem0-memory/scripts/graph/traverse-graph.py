@@ -3,8 +3,7 @@
 Traverse mem0 graph relationships for multi-hop queries.
 Usage: ./traverse-graph.py --memory-id "mem_123" --depth 2 [--relation-type "recommends"]
 """
-import argparse
-import json
+import asyncio
 import sys
 from pathlib import Path
 from typing import Any
@@ -14,167 +13,243 @@ _SCRIPT_DIR = Path(__file__).parent
 _LIB_DIR = _SCRIPT_DIR.parent / "lib"
 if str(_LIB_DIR) not in sys.path:
     sys.path.insert(0, str(_LIB_DIR))
-from mem0_client import get_mem0_client  # type: ignore  # noqa: E402
+from cli import mem0_cli  # type: ignore  # noqa: E402
+from mem0_client import get_async_mem0_client  # type: ignore  # noqa: E402
 
+# Cap concurrent API calls within one traversal
+MAX_CONCURRENT_REQUESTS = 16
 
-def traverse_graph(
+
+async def _fetch_relations(
     client,
+    memory: dict[str, Any],
     memory_id: str,
-    depth: int = 2,
     relation_type: str | None = None,
-    visited: set[str] | None = None,
-    path: list[dict[str, Any]] | None = None
+    semaphore: asyncio.Semaphore | None = None
+) -> list[dict[str, Any]]:
+    """Fetch a memory's graph relations when its metadata carries none.
+
+    Prefers the dedicated graph endpoint, which returns deterministic
+    neighbors without an embedding lookup; a relation_type filter is pushed
+    down server-side so non-matching edges never cross the wire. Falls back
+    to the older entity-text search for SDKs without get_related.
+    """
+    try:
+        async with semaphore or asyncio.Semaphore(1):
+            if relation_type:
+                related = await client.get_related(memory_id=memory_id, relation_type=relation_type)
+            else:
+                related = await client.get_related(memory_id=memory_id)
+        if isinstance(related, dict):
+            return related.get("relations", [])
+        return related or []
+    except AttributeError:
+        pass
+    except Exception:
+        return []
+
+    entities = memory.get("metadata", {}).get("entities", [])
+    if not entities:
+        return []
+    query = " ".join([e.get("name", "") for e in entities[:3]])
+    search_result = await client.search(
+        query=query,
+        filters={"user_id": memory.get("user_id")} if memory.get("user_id") else None,
+        limit=10,
+        enable_graph=True
+    )
+    relations = search_result.get("relations", [])
+    if relation_type:
+        relations = [r for r in relations if r.get("type") == relation_type]
+    return relations
+
+
+async def _prefetch_memories(
+    client,
+    memory_ids: list[str],
+    cache: dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> None:
+    """Fetch a BFS frontier's memories into the cache.
+
+    Prefers one bulk get_many call for the whole frontier (N round-trips
+    collapse to 1); clients without it fall back to gathering per-id gets
+    concurrently, still ~1 RTT per level. Failed fetches are skipped.
+    """
+    try:
+        fetched = await client.get_many(memory_ids=memory_ids)
+    except AttributeError:
+        fetched = None
+    except Exception:
+        return
+
+    if fetched is not None:
+        if isinstance(fetched, dict):
+            cache.update(fetched)
+        else:
+            for memory in fetched:
+                mid = memory.get("id") or memory.get("memory_id")
+                if mid:
+                    cache[mid] = memory
+        return
+
+    async def fetch(memory_id: str) -> Any:
+        try:
+            async with semaphore:
+                return await client.get(memory_id=memory_id)
+        except Exception:
+            return None
+
+    memories = await asyncio.gather(*(fetch(mid) for mid in memory_ids))
+    for memory_id, memory in zip(memory_ids, memories):
+        if memory is not None:
+            cache[memory_id] = memory
+
+
+async def traverse_graph(
+    client,
+    memory_id: str,
+    depth: int = 2,
+    relation_type: str | None = None
 ) -> list[dict[str, Any]]:
     """
     Traverse graph relationships from a memory with multi-hop support.
-    
+
+    Iterative BFS with a single shared visited set: each memory is fetched
+    at most once, and no per-branch set copies are made (the recursive
+    version copied `visited` at every branch, O(B^D) allocations). All API
+    calls for one level — memory fetches and relation expansions — run
+    concurrently, bounded by a semaphore.
+
     Args:
-        client: mem0 MemoryClient instance
+        client: mem0 AsyncMemoryClient instance
         memory_id: Starting memory ID
         depth: Maximum traversal depth
         relation_type: Optional filter by relation type
-        visited: Set of visited memory IDs (for cycle detection)
-        path: Current traversal path
-    
+
     Returns:
         List of traversal paths with related memories
     """
-    if visited is None:
-        visited = set()
-    if path is None:
-        path = []
-    
-    # Avoid cycles
-    if memory_id in visited or depth <= 0:
+    if depth <= 0:
         return []
-    
-    visited.add(memory_id)
-    
-    # Get the memory
-    try:
-        memory = client.get(memory_id=memory_id)
-    except Exception:
-        return []
-    
-    # Add to current path
-    current_path = path + [{
-        "memory_id": memory_id,
-        "memory": memory,
-        "depth": len(path)
-    }]
-    
-    results = []
-    
-    # If we've reached max depth, return current path
-    if depth == 1:
-        return [{"path": current_path, "depth": len(current_path) - 1}]
-    
-    # Get relations from memory metadata or via search
-    memory_metadata = memory.get("metadata", {})
-    relations = memory_metadata.get("relations", [])
-    
-    # If no relations in metadata, try searching with graph enabled
-    if not relations:
-        entities = memory_metadata.get("entities", [])
-        if entities:
-            query = " ".join([e.get("name", "") for e in entities[:3]])
-            search_result = client.search(
-                query=query,
-                filters={"user_id": memory.get("user_id")} if memory.get("user_id") else None,
-                limit=10,
-                enable_graph=True
-            )
-            relations = search_result.get("relations", [])
-    
-    # Traverse each relation
-    for relation in relations:
-        if relation_type and relation.get("type") != relation_type:
-            continue
-        
-        related_id = relation.get("target_id") or relation.get("memory_id")
-        if not related_id or related_id in visited:
-            continue
-        
-        # Recursively traverse
-        deeper_paths = traverse_graph(
-            client,
-            related_id,
-            depth=depth - 1,
-            relation_type=relation_type,
-            visited=visited.copy(),  # Copy to allow parallel paths
-            path=current_path
-        )
-        
-        # Add relation info to paths
-        for path_result in deeper_paths:
-            if path_result["path"]:
-                # Add relation info to the connection
-                path_result["path"][-1]["relation"] = {
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # Frontier entries: (memory_id, path so far, relation that led here)
+    frontier: list[tuple[str, list[dict[str, Any]], dict[str, Any] | None]] = [
+        (memory_id, [], None)
+    ]
+    visited = {memory_id}
+    results: list[dict[str, Any]] = []
+    # Per-invocation memory cache: convergent paths and prefetched frontiers
+    # resolve from here instead of re-issuing client.get round-trips
+    mem_cache: dict[str, Any] = {}
+
+    while frontier:
+        # Fetch the whole level concurrently before expanding it
+        missing = [mid for mid, _, _ in frontier if mid not in mem_cache]
+        if missing:
+            await _prefetch_memories(client, missing, mem_cache, semaphore)
+
+        # Resolve each node's relations, expanding siblings concurrently
+        # when the graph endpoint must be consulted
+        level: list[tuple[str, list[dict[str, Any]], dict[str, Any] | None, Any]] = []
+        relation_tasks: dict[str, asyncio.Task] = {}
+        for current_id, path, incoming_relation in frontier:
+            memory = mem_cache.get(current_id)
+            if memory is None:
+                continue
+            level.append((current_id, path, incoming_relation, memory))
+
+            needs_expansion = len(path) + 1 < depth
+            if needs_expansion and not memory.get("metadata", {}).get("relations", []):
+                relation_tasks[current_id] = asyncio.ensure_future(
+                    _fetch_relations(client, memory, current_id, relation_type, semaphore)
+                )
+        if relation_tasks:
+            await asyncio.gather(*relation_tasks.values(), return_exceptions=True)
+
+        next_frontier: list[tuple[str, list[dict[str, Any]], dict[str, Any] | None]] = []
+        for current_id, path, incoming_relation, memory in level:
+            node: dict[str, Any] = {
+                "memory_id": current_id,
+                "memory": memory,
+                "depth": len(path)
+            }
+            if incoming_relation is not None:
+                node["relation"] = incoming_relation
+            current_path = path + [node]
+
+            # Max depth reached: this path is terminal
+            if len(current_path) >= depth:
+                results.append({"path": current_path, "depth": len(current_path) - 1})
+                continue
+
+            # Get relations from memory metadata, or from the graph endpoint
+            # (which filters by relation_type server-side)
+            relations = memory.get("metadata", {}).get("relations", [])
+            if relations:
+                if relation_type:
+                    relations = [r for r in relations if r.get("type") == relation_type]
+            else:
+                task = relation_tasks.get(current_id)
+                if task is not None and not task.cancelled() and task.exception() is None:
+                    relations = task.result()
+                else:
+                    relations = []
+
+            # Enqueue unvisited neighbors; mark visited at enqueue time (BFS
+            # invariant: first arrival is via a shortest path)
+            expanded = False
+            for relation in relations:
+                related_id = relation.get("target_id") or relation.get("memory_id")
+                if not related_id or related_id in visited:
+                    continue
+
+                visited.add(related_id)
+                next_frontier.append((related_id, current_path, {
                     "type": relation.get("type"),
-                    "source_id": memory_id,
+                    "source_id": current_id,
                     "target_id": related_id,
                     "strength": relation.get("strength", 1.0)
-                }
-            results.append(path_result)
-    
-    # If no deeper paths, return current path as a result
-    if not results and current_path:
-        results.append({"path": current_path, "depth": len(current_path) - 1})
-    
+                }))
+                expanded = True
+
+            # No unvisited children: this path is terminal
+            if not expanded:
+                results.append({"path": current_path, "depth": len(current_path) - 1})
+
+        frontier = next_frontier
+
     return results
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Traverse mem0 graph relationships")
-    parser.add_argument("--memory-id", required=True, help="Starting memory ID")
-    parser.add_argument("--depth", type=int, default=2, help="Maximum traversal depth (default: 2)")
-    parser.add_argument("--relation-type", help="Filter by relation type (e.g., 'recommends', 'uses')")
-    parser.add_argument("--api-key", help="Or use MEM0_API_KEY env")
-    parser.add_argument("--org-id", help="Or use MEM0_ORG_ID env")
-    parser.add_argument("--project-id", help="Or use MEM0_PROJECT_ID env")
-    args = parser.parse_args()
+@mem0_cli("Traverse mem0 graph relationships", [
+    ("--memory-id", {"required": True, "help": "Starting memory ID"}),
+    ("--depth", {"type": int, "default": 2, "help": "Maximum traversal depth (default: 2)"}),
+    ("--relation-type", {"help": "Filter by relation type (e.g., 'recommends', 'uses')"}),
+])
+def main(client, args):
+    async_client = get_async_mem0_client(
+        api_key=args.api_key,
+        org_id=args.org_id,
+        project_id=args.project_id
+    )
+    paths = asyncio.run(traverse_graph(
+        async_client,
+        memory_id=args.memory_id,
+        depth=args.depth,
+        relation_type=args.relation_type
+    ))
 
-    try:
-        client = get_mem0_client(
-            api_key=args.api_key,
-            org_id=args.org_id,
-            project_id=args.project_id
-        )
-
-        paths = traverse_graph(
-            client,
-            memory_id=args.memory_id,
-            depth=args.depth,
-            relation_type=args.relation_type
-        )
-
-        print(json.dumps({
-            "success": True,
-            "memory_id": args.memory_id,
-            "depth": args.depth,
-            "relation_type": args.relation_type,
-            "path_count": len(paths),
-            "paths": paths
-        }, indent=2))
-
-    except ValueError as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": "ValueError"
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
-    except ImportError as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": "ImportError"
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": type(e).__name__
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
+    return {
+        "success": True,
+        "memory_id": args.memory_id,
+        "depth": args.depth,
+        "relation_type": args.relation_type,
+        "path_count": len(paths),
+        "paths": paths
+    }
 
 
 if __name__ == "__main__":
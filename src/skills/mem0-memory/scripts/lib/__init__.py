@@ -1,4 +1,4 @@
 """Mem0 client library for skill scripts."""
-from .mem0_client import get_mem0_client
+from .mem0_client import get_async_mem0_client, get_mem0_client, json_dumps, json_loads
 
-__all__ = ["get_mem0_client"]
+__all__ = ["get_async_mem0_client", "get_mem0_client", "json_dumps", "json_loads"]
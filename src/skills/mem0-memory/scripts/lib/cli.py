@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Shared argparse + error-envelope plumbing for mem0 skill scripts.
+
+Every script used to re-declare the same --api-key/--org-id/--project-id
+arguments and the same ValueError/ImportError/Exception ladder that dumps a
+JSON error envelope and exits 1. The mem0_cli decorator centralizes both, so
+each script only declares its own arguments and returns its success payload.
+"""
+import sys
+
+try:
+    from .mem0_client import get_mem0_client, json_dumps
+except ImportError:  # lib dir placed directly on sys.path by the scripts
+    from mem0_client import get_mem0_client, json_dumps
+
+
+def emit_json(payload, stream=None) -> None:
+    """Stream a JSON payload to stdout (or the given stream)."""
+    stream = stream or sys.stdout
+    stream.write(json_dumps(payload, indent=True))
+    stream.write("\n")
+
+
+def _emit_error(error: Exception, error_type: str) -> None:
+    sys.stderr.write(json_dumps({"error": str(error), "type": error_type}, indent=True))
+    sys.stderr.write("\n")
+
+
+def mem0_cli(description: str, arguments: list[tuple[str, dict]] | None = None):
+    """Wrap a script entrypoint with shared CLI and error handling.
+
+    The decorated function receives (client, args) and returns the success
+    payload to print (or None if it handles its own output).
+
+    Usage:
+        @mem0_cli("Get mem0 memory history", [("--memory-id", {"required": True})])
+        def main(client, args):
+            return {"success": True, "history": client.history(memory_id=args.memory_id)}
+    """
+    def decorator(fn):
+        def wrapper():
+            import argparse
+
+            parser = argparse.ArgumentParser(description=description)
+            for flag, opts in arguments or []:
+                parser.add_argument(flag, **opts)
+            parser.add_argument("--api-key", help="Or use MEM0_API_KEY env")
+            parser.add_argument("--org-id", help="Or use MEM0_ORG_ID env")
+            parser.add_argument("--project-id", help="Or use MEM0_PROJECT_ID env")
+            args = parser.parse_args()
+
+            try:
+                client = get_mem0_client(
+                    api_key=args.api_key,
+                    org_id=args.org_id,
+                    project_id=args.project_id
+                )
+                payload = fn(client, args)
+                if payload is not None:
+                    emit_json(payload)
+            except ValueError as e:
+                _emit_error(e, "ValueError")
+                sys.exit(1)
+            except ImportError as e:
+                _emit_error(e, "ImportError")
+                sys.exit(1)
+            except Exception as e:
+                _emit_error(e, type(e).__name__)
+                sys.exit(1)
+
+        return wrapper
+    return decorator
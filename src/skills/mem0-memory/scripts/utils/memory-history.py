@@ -3,8 +3,6 @@
 Get change history (audit trail) for a memory.
 Usage: ./memory-history.py --memory-id "mem_abc123"
 """
-import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -13,49 +11,18 @@ _SCRIPT_DIR = Path(__file__).parent
 _LIB_DIR = _SCRIPT_DIR.parent / "lib"
 if str(_LIB_DIR) not in sys.path:
     sys.path.insert(0, str(_LIB_DIR))
-from mem0_client import get_mem0_client  # type: ignore  # noqa: E402
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Get mem0 memory history")
-    parser.add_argument("--memory-id", required=True, help="Memory ID")
-    parser.add_argument("--api-key", help="Or use MEM0_API_KEY env")
-    parser.add_argument("--org-id", help="Or use MEM0_ORG_ID env")
-    parser.add_argument("--project-id", help="Or use MEM0_PROJECT_ID env")
-    args = parser.parse_args()
-
-    try:
-        client = get_mem0_client(
-            api_key=args.api_key,
-            org_id=args.org_id,
-            project_id=args.project_id
-        )
-
-        result = client.history(memory_id=args.memory_id)
-
-        print(json.dumps({
-            "success": True,
-            "history": result
-        }, indent=2))
-
-    except ValueError as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": "ValueError"
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
-    except ImportError as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": "ImportError"
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(json.dumps({
-            "error": str(e),
-            "type": type(e).__name__
-        }, indent=2), file=sys.stderr)
-        sys.exit(1)
+from cli import mem0_cli  # type: ignore  # noqa: E402
+
+
+@mem0_cli("Get mem0 memory history", [
+    ("--memory-id", {"required": True, "help": "Memory ID"}),
+])
+def main(client, args):
+    result = client.history(memory_id=args.memory_id)
+    return {
+        "success": True,
+        "history": result
+    }
 
 
 if __name__ == "__main__":
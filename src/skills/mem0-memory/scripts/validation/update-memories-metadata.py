@@ -3,8 +3,11 @@
 Update existing Mem0 memories with enhanced metadata (entity_type, color_group, category).
 This script adds metadata fields to existing memories for better visualization and filtering.
 """
+import asyncio
 import json
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -19,131 +22,211 @@ from mem0_client import get_mem0_client  # type: ignore  # noqa: E402
 
 USER_ID = "orchestkit:all-agents"
 
+# Classification tables, built once at import so the per-memory work is a
+# single C-level regex scan plus dict lookups instead of a ladder of Python
+# substring tests rebuilding dicts per call.
+_TYPE_TO_ENTITY = {
+    "agent": "Agent",
+    "skill": "Skill",
+    "technology": "Technology",
+    "category": "Category",
+    "architecture": "Architecture",
+    "architecture-decision": "Architecture",
+}
 
-def extract_entity_type_from_memory(memory: Dict[str, Any]) -> tuple[str, str, str]:
-    """Extract entity_type, color_group, and category from memory content and existing metadata."""
-    metadata = memory.get("metadata", {})
-    content = memory.get("memory", "").lower()
-    
+# Lookahead alternation preserves the original if/elif priority (Agent before
+# Skill before Technology, ...) while matching in one pass
+_CONTENT_ENTITY_RE = re.compile(
+    r"(?:(?=.*agent)(?=.*(?:uses|specialized))(?P<Agent>)"
+    r"|(?=.*skill)(?=.*(?:pattern|provides))(?P<Skill>)"
+    r"|(?=.*(?:technology|framework))(?P<Technology>)"
+    r"|(?=.*(?:category|contains))(?P<Category>)"
+    r"|(?=.*(?:architecture|decision))(?P<Architecture>))",
+    re.DOTALL,
+)
+
+_COLOR_GROUP_MAP = {
+    "Agent": "agent",
+    "Skill": "skill",
+    "Technology": "technology",
+    "Category": "category",
+    "Architecture": "architecture"
+}
+
+_NAME_CATEGORY_RE = re.compile(
+    r"(?P<backend>backend|fastapi|api)"
+    r"|(?P<frontend>frontend|react)"
+    r"|(?P<ai>ai|llm|rag|langgraph)"
+    r"|(?P<testing>test)"
+    r"|(?P<security>security|auth|owasp)"
+    r"|(?P<context>memory|context)"
+)
+
+_NAME_CATEGORY_MAP = {
+    "backend": "backend-skills",
+    "frontend": "frontend-skills",
+    "ai": "ai-llm-skills",
+    "testing": "testing-skills",
+    "security": "security-skills",
+    "context": "context-skills",
+}
+
+_ENTITY_CATEGORY_MAP = {
+    "Agent": "agents",
+    "Technology": "technologies",
+    "Architecture": "architecture-decisions",
+}
+
+
+@lru_cache(maxsize=4096)
+def _infer(
+    name: Optional[str],
+    type_val: Optional[str],
+    existing_entity: Optional[str],
+    existing_category: Optional[str],
+    content_key: str
+) -> tuple[str, str, str]:
+    """Cached inference core keyed on the hashable classification inputs.
+
+    Catalogs contain many duplicate names and near-identical contents
+    (reruns, repeated registrations); repeat keys skip the regex work.
+    """
     # Check existing metadata first
-    if "entity_type" in metadata:
-        entity_type = metadata["entity_type"]
-    elif "type" in metadata:
-        type_val = metadata["type"]
-        if type_val == "agent":
-            entity_type = "Agent"
-        elif type_val == "skill":
-            entity_type = "Skill"
-        elif type_val == "technology":
-            entity_type = "Technology"
-        elif type_val == "category":
-            entity_type = "Category"
-        elif type_val in ["architecture", "architecture-decision"]:
-            entity_type = "Architecture"
-        else:
-            entity_type = type_val.capitalize()
+    if existing_entity is not None:
+        entity_type = existing_entity
+    elif type_val is not None:
+        entity_type = _TYPE_TO_ENTITY.get(type_val, type_val.capitalize())
     else:
         # Infer from content
-        if "agent" in content and ("uses" in content or "specialized" in content):
-            entity_type = "Agent"
-        elif "skill" in content and ("pattern" in content or "provides" in content):
-            entity_type = "Skill"
-        elif "technology" in content or "framework" in content:
-            entity_type = "Technology"
-        elif "category" in content or "contains" in content:
-            entity_type = "Category"
-        elif "architecture" in content or "decision" in content:
-            entity_type = "Architecture"
-        else:
-            entity_type = "Unknown"
-    
-    # Determine color_group
-    color_group_map = {
-        "Agent": "agent",
-        "Skill": "skill",
-        "Technology": "technology",
-        "Category": "category",
-        "Architecture": "architecture"
-    }
-    color_group = color_group_map.get(entity_type, "unknown")
-    
+        match = _CONTENT_ENTITY_RE.match(content_key)
+        entity_type = match.lastgroup if match and match.lastgroup else "Unknown"
+
+    color_group = _COLOR_GROUP_MAP.get(entity_type, "unknown")
+
     # Determine category from metadata or content
-    if "category" in metadata:
-        category = metadata["category"]
-    elif "name" in metadata:
-        name = metadata["name"].lower()
-        # Map names to categories
-        if "backend" in name or "fastapi" in name or "api" in name:
-            category = "backend-skills"
-        elif "frontend" in name or "react" in name:
-            category = "frontend-skills"
-        elif "ai" in name or "llm" in name or "rag" in name or "langgraph" in name:
-            category = "ai-llm-skills"
-        elif "test" in name:
-            category = "testing-skills"
-        elif "security" in name or "auth" in name or "owasp" in name:
-            category = "security-skills"
-        elif "memory" in name or "context" in name:
-            category = "context-skills"
-        elif entity_type == "Agent":
-            category = "agents"
-        elif entity_type == "Technology":
-            category = "technologies"
-        elif entity_type == "Architecture":
-            category = "architecture-decisions"
+    if existing_category is not None:
+        category = existing_category
+    elif name is not None:
+        match = _NAME_CATEGORY_RE.search(name.lower())
+        if match and match.lastgroup:
+            category = _NAME_CATEGORY_MAP[match.lastgroup]
         else:
-            category = "unknown"
+            category = _ENTITY_CATEGORY_MAP.get(entity_type, "unknown")
     else:
         category = "unknown"
-    
+
     return entity_type, color_group, category
 
 
-def update_memory_metadata(client, memory_id: str, memory: Dict[str, Any], dry_run: bool = False) -> bool:
-    """Update a single memory with enhanced metadata."""
+def extract_entity_type_from_memory(memory: Dict[str, Any]) -> tuple[str, str, str]:
+    """Extract entity_type, color_group, and category from memory content and existing metadata."""
+    metadata = memory.get("metadata", {})
+    # Short lowercased prefix keeps cache keys cheap; content only drives
+    # inference when type metadata is absent
+    content_key = memory.get("memory", "")[:64].lower()
+
+    return _infer(
+        metadata.get("name"),
+        metadata.get("type"),
+        metadata.get("entity_type"),
+        metadata.get("category"),
+        content_key
+    )
+
+
+def plan_memory_update(memory_id: str, memory: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Compute the metadata update for one memory, or None if up to date."""
     entity_type, color_group, category = extract_entity_type_from_memory(memory)
-    
-    existing_metadata = memory.get("metadata", {}).copy()
-    
+
+    existing_metadata = memory.get("metadata", {})
+
     # Only update if missing or different
     needs_update = False
     new_metadata = existing_metadata.copy()
-    
+
     if existing_metadata.get("entity_type") != entity_type:
         new_metadata["entity_type"] = entity_type
         needs_update = True
-    
+
     if existing_metadata.get("color_group") != color_group:
         new_metadata["color_group"] = color_group
         needs_update = True
-    
+
     if existing_metadata.get("category") != category:
         new_metadata["category"] = category
         needs_update = True
-    
+
     if not existing_metadata.get("plugin_component"):
         new_metadata["plugin_component"] = True
         needs_update = True
-    
+
     if not needs_update:
-        return False
-    
-    if dry_run:
-        print(f"  [DRY RUN] Would update {memory_id[:8]}...: entity_type={entity_type}, color_group={color_group}, category={category}")
-        return True
-    
-    try:
-        # Update memory with new metadata
-        client.update(
-            memory_id=memory_id,
-            text=memory.get("memory"),  # Keep existing text
-            metadata=new_metadata
+        return None
+
+    return {
+        "memory_id": memory_id,
+        "text": memory.get("memory"),  # Keep existing text
+        "metadata": new_metadata,
+        "entity_type": entity_type,
+        "color_group": color_group,
+        "category": category,
+    }
+
+
+async def dispatch_updates(client, updates: list) -> int:
+    """Apply planned updates concurrently; returns the success count.
+
+    Each client.update is one HTTP round-trip, so dispatching them
+    sequentially makes the run O(M * RTT). Running them through to_thread
+    under a semaphore caps in-flight requests while overlapping latency.
+    """
+    semaphore = asyncio.Semaphore(20)
+
+    async def run(update: Dict[str, Any]) -> bool:
+        memory_id = update["memory_id"]
+        async with semaphore:
+            try:
+                await asyncio.to_thread(
+                    client.update,
+                    memory_id=memory_id,
+                    text=update["text"],
+                    metadata=update["metadata"]
+                )
+                print(f"  ✓ Updated {memory_id[:8]}...: {update['entity_type']} ({update['category']})")
+                return True
+            except Exception as e:
+                print(f"  ✗ Failed to update {memory_id[:8]}...: {e}", file=sys.stderr)
+                return False
+
+    results = await asyncio.gather(*(run(u) for u in updates))
+    return sum(results)
+
+
+def iter_memories(client, user_id: Optional[str], page_size: int = 200, max_total: Optional[int] = None):
+    """Yield memories page by page instead of materializing the catalog.
+
+    Update planning starts as soon as the first page lands, and peak memory
+    stays at one page rather than the full result set.
+    """
+    offset = 0
+    yielded = 0
+    while True:
+        result = client.search(
+            query="OrchestKit Plugin structure agent skill technology",
+            filters={"user_id": user_id} if user_id else None,
+            limit=page_size,
+            offset=offset,
+            enable_graph=True
         )
-        print(f"  ✓ Updated {memory_id[:8]}...: {entity_type} ({category})")
-        return True
-    except Exception as e:
-        print(f"  ✗ Failed to update {memory_id[:8]}...: {e}", file=sys.stderr)
-        return False
+        batch = result.get("results", [])
+        for memory in batch:
+            yield memory
+            yielded += 1
+            if max_total is not None and yielded >= max_total:
+                return
+        if len(batch) < page_size:
+            return
+        offset += page_size
 
 
 def main():
@@ -159,38 +242,44 @@ def main():
         client = get_mem0_client()
         
         print(f"Fetching memories for user_id: {args.user_id}")
-        
-        # Get all memories (use broad query since empty query not allowed)
-        result = client.search(
-            query="OrchestKit Plugin structure agent skill technology",
-            filters={"user_id": args.user_id} if args.user_id else None,
-            limit=args.limit or 1000,
-            enable_graph=True
-        )
-        
-        memories = result.get("results", [])
-        print(f"Found {len(memories)} memories to process\n")
-        
+
         if args.dry_run:
             print("DRY RUN MODE - No changes will be made\n")
-        
-        updated_count = 0
+
+        # Stream pages and plan updates as they arrive, then dispatch the
+        # batch concurrently (broad query since empty query not allowed)
+        updates = []
         skipped_count = 0
-        
-        for memory in memories:
+        total_count = 0
+        for memory in iter_memories(client, args.user_id, max_total=args.limit):
             memory_id = memory.get("id")
             if not memory_id:
                 continue
-            
-            if update_memory_metadata(client, memory_id, memory, dry_run=args.dry_run):
-                updated_count += 1
-            else:
+            total_count += 1
+
+            update = plan_memory_update(memory_id, memory)
+            if update is None:
                 skipped_count += 1
+            else:
+                updates.append(update)
+
+        print(f"Found {total_count} memories to process\n")
+
+        if args.dry_run:
+            for update in updates:
+                print(
+                    f"  [DRY RUN] Would update {update['memory_id'][:8]}...: "
+                    f"entity_type={update['entity_type']}, "
+                    f"color_group={update['color_group']}, category={update['category']}"
+                )
+            updated_count = len(updates)
+        else:
+            updated_count = asyncio.run(dispatch_updates(client, updates))
         
         print(f"\n=== Summary ===")
         print(f"Updated: {updated_count}")
         print(f"Skipped (already up-to-date): {skipped_count}")
-        print(f"Total: {len(memories)}")
+        print(f"Total: {total_count}")
         
         if args.dry_run:
             print("\nRun without --dry-run to apply updates")
@@ -11,13 +11,27 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
 from collections.abc import Callable
-from datetime import datetime
+from functools import cached_property
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String, delete, select
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    bindparam,
+    lambda_stmt,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -25,6 +39,14 @@ from sqlalchemy.orm import DeclarativeBase
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes straight to bytes in C; stdlib json is the fallback
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 # =============================================================================
 # Models
@@ -40,18 +62,38 @@ class OutboxMessage(Base):
 
     __tablename__ = "outbox"
 
+    # Partial index covering the publisher's polling query: published rows
+    # quickly dwarf pending ones, so indexing only `published_at IS NULL`
+    # keeps the SKIP LOCKED scan at O(log n + batch) regardless of table size
+    __table_args__ = (
+        Index(
+            "outbox_pending_idx",
+            "created_at",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+    )
+
     id: UUID = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     aggregate_type: str = Column(String(100), nullable=False, index=True)
     aggregate_id: UUID = Column(PGUUID(as_uuid=True), nullable=False, index=True)
     event_type: str = Column(String(100), nullable=False)
     payload: dict = Column(JSONB, nullable=False)
-    created_at: datetime = Column(DateTime, nullable=False, default=lambda: datetime.now(datetime.UTC))
+    # Wire-ready event bytes, serialized once at write time so the publisher
+    # hot loop does zero JSON encoding; JSONB payload stays for queryability
+    payload_bytes: bytes | None = Column(LargeBinary, nullable=True)
+    created_at: datetime = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
     published_at: datetime | None = Column(DateTime, nullable=True)
     retry_count: int = Column(Integer, nullable=False, default=0)
     last_error: str | None = Column(String(500), nullable=True)
 
-    def to_event_dict(self) -> dict[str, Any]:
-        """Convert to event dictionary for publishing."""
+    @cached_property
+    def event_dict(self) -> dict[str, Any]:
+        """Event dictionary for publishing.
+
+        Rows are immutable once written, so the UUID stringification and
+        isoformat run once per instance lifetime instead of on every
+        publish attempt.
+        """
         return {
             "id": str(self.id),
             "type": self.event_type,
@@ -62,6 +104,38 @@ class OutboxMessage(Base):
         }
 
 
+# Claim statements built once at import; limits enter as bind parameters,
+# so each poll skips the per-iteration AST construction and hits
+# SQLAlchemy's compiled cache directly.
+#
+# Claiming is per *aggregate*, not per row: each publisher takes a
+# transaction-scoped advisory lock on the aggregates it picks up, then
+# publishes all of that aggregate's pending messages in created_at order.
+# Row-level SKIP LOCKED would let two publishers split one aggregate's
+# messages and emit them out of order.
+_PENDING_AGGREGATES_STMT = text(
+    """
+    SELECT aggregate_id FROM (
+        SELECT aggregate_id, min(created_at) AS first_created
+        FROM outbox
+        WHERE published_at IS NULL AND retry_count < :max_r
+        GROUP BY aggregate_id
+        ORDER BY first_created
+        LIMIT :agg_limit
+    ) AS pending
+    WHERE pg_try_advisory_xact_lock(hashtext(aggregate_id::text))
+    """
+)
+
+_CLAIMED_MESSAGES_STMT = lambda_stmt(
+    lambda: select(OutboxMessage)
+    .where(OutboxMessage.published_at.is_(None))
+    .where(OutboxMessage.retry_count < bindparam("max_r"))
+    .where(OutboxMessage.aggregate_id.in_(bindparam("agg_ids", expanding=True)))
+    .order_by(OutboxMessage.created_at)
+)
+
+
 # =============================================================================
 # Atomic Write Helper
 # =============================================================================
@@ -97,12 +171,17 @@ async def write_with_outbox(
                 {"customer_id": customer_id, "total": 100.0}
             )
     """
+    # Assign id/created_at eagerly (instead of at flush) so the event can
+    # be serialized to bytes here, off the publisher's hot path
     outbox_message = OutboxMessage(
+        id=uuid4(),
         aggregate_type=aggregate_type,
         aggregate_id=entity.id,
         event_type=event_type,
         payload=payload,
+        created_at=datetime.now(UTC),
     )
+    outbox_message.payload_bytes = _json_dumps(outbox_message.event_dict)
 
     session.add(entity)
     session.add(outbox_message)
@@ -114,21 +193,42 @@ async def write_with_outbox(
 # Background Publisher
 # =============================================================================
 
+# Install alongside the table so inserts wake the publisher immediately
+# (see OutboxPublisher.listen_connection); polling remains the fallback
+OUTBOX_NOTIFY_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION outbox_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('outbox_new', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER outbox_notify
+AFTER INSERT ON outbox
+FOR EACH STATEMENT EXECUTE FUNCTION outbox_notify();
+"""
+
+
 class OutboxPublisher:
     """
     Background publisher for outbox messages.
 
-    Polls the outbox table and publishes pending messages to a message broker.
-    Uses row-level locking to support multiple publisher instances.
+    Publishes pending messages to a message broker. With a LISTEN/NOTIFY
+    connection (see `listen_connection`), new rows wake the publisher in
+    ~ms and idle polls disappear; without one, it polls every
+    `poll_interval` seconds. Uses row-level locking to support multiple
+    publisher instances.
     """
 
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
-        publish_fn: Callable[[str, str, dict], Any],
+        publish_fn: Callable[[str, str, bytes], Any],
         poll_interval: float = 1.0,
         batch_size: int = 100,
         max_retries: int = 5,
+        batch_concurrency: int = 20,
+        listen_connection: Any = None,
     ):
         """
         Initialize the publisher.
@@ -137,23 +237,39 @@ class OutboxPublisher:
             session_factory: SQLAlchemy async session factory
             publish_fn: Async function(topic, key, value) to publish messages
             poll_interval: Seconds between polls when queue is empty
+                (fallback interval when LISTEN/NOTIFY is active)
             batch_size: Maximum messages to process per batch
             max_retries: Maximum retry attempts before giving up
+            batch_concurrency: Max in-flight publishes within a batch
+            listen_connection: Optional asyncpg connection used to LISTEN
+                on the `outbox_new` channel (requires the
+                OUTBOX_NOTIFY_TRIGGER_SQL trigger)
         """
         self.session_factory = session_factory
         self.publish_fn = publish_fn
         self.poll_interval = poll_interval
         self.batch_size = batch_size
         self.max_retries = max_retries
+        self._publish_sem = asyncio.Semaphore(batch_concurrency)
+        self._listen_connection = listen_connection
+        self._new_rows = asyncio.Event()
         self._running = False
         self._task: asyncio.Task | None = None
 
+    def _on_notify(self, *_args: Any) -> None:
+        """asyncpg listener callback: flag that new rows arrived."""
+        self._new_rows.set()
+
     async def start(self) -> None:
         """Start the publisher background task."""
         if self._running:
             logger.warning("Publisher already running")
             return
 
+        if self._listen_connection is not None:
+            await self._listen_connection.add_listener("outbox_new", self._on_notify)
+            logger.info("Listening on outbox_new channel")
+
         logger.info(
             f"Starting outbox publisher (interval={self.poll_interval}s, "
             f"batch={self.batch_size}, retries={self.max_retries})"
@@ -177,12 +293,21 @@ class OutboxPublisher:
                 self._task.cancel()
 
     async def _run_loop(self) -> None:
-        """Main polling loop."""
+        """Main loop: wake on NOTIFY (when listening) or poll_interval."""
         while self._running:
             try:
                 published = await self._process_batch()
                 if published == 0:
-                    await asyncio.sleep(self.poll_interval)
+                    # Block until a NOTIFY lands or the poll interval
+                    # elapses (covers missed notifications); without a
+                    # listen connection this degrades to plain polling
+                    try:
+                        await asyncio.wait_for(
+                            self._new_rows.wait(), timeout=self.poll_interval
+                        )
+                    except TimeoutError:
+                        pass
+                    self._new_rows.clear()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -192,39 +317,98 @@ class OutboxPublisher:
         logger.info("Publisher loop stopped")
 
     async def _process_batch(self) -> int:
-        """Process a batch of pending messages."""
+        """Process a batch of pending messages, claimed per aggregate."""
         async with self.session_factory() as session:
-            # Lock rows to prevent duplicate processing
-            stmt = (
-                select(OutboxMessage)
-                .where(OutboxMessage.published_at.is_(None))
-                .where(OutboxMessage.retry_count < self.max_retries)
-                .order_by(OutboxMessage.created_at)
-                .limit(self.batch_size)
-                .with_for_update(skip_locked=True)
+            # Claim whole aggregates via advisory locks (released at
+            # commit) so concurrent publishers never interleave one
+            # aggregate's events out of order
+            agg_result = await session.execute(
+                _PENDING_AGGREGATES_STMT,
+                {"max_r": self.max_retries, "agg_limit": self.batch_size},
+            )
+            aggregate_ids = [row[0] for row in agg_result]
+
+            if not aggregate_ids:
+                return 0
+
+            result = await session.execute(
+                _CLAIMED_MESSAGES_STMT,
+                {"max_r": self.max_retries, "agg_ids": aggregate_ids},
             )
-            result = await session.execute(stmt)
             messages = result.scalars().all()
 
             if not messages:
                 return 0
 
-            published_count = 0
-            for msg in messages:
+            # Publish concurrently (bounded by the semaphore) instead of
+            # serializing the batch on broker latency: a 100-message batch
+            # completes in ~max(single publish) rather than sum of them
+            async def _publish_one(msg: OutboxMessage) -> tuple[UUID, str | None]:
                 topic = f"{msg.aggregate_type.lower()}-events"
                 key = str(msg.aggregate_id)
 
-                try:
-                    await self.publish_fn(topic, key, msg.to_event_dict())
-                    msg.published_at = datetime.now(datetime.UTC)
-                    published_count += 1
-                except Exception as e:
-                    msg.retry_count += 1
-                    msg.last_error = str(e)[:500]
-                    logger.warning(
-                        f"Failed to publish {msg.id} "
-                        f"(attempt {msg.retry_count}/{self.max_retries}): {e}"
-                    )
+                # Rows written before payload_bytes existed fall back to
+                # serializing here
+                value = msg.payload_bytes or _json_dumps(msg.event_dict)
+
+                async with self._publish_sem:
+                    try:
+                        await self.publish_fn(topic, key, value)
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to publish {msg.id} "
+                            f"(attempt {msg.retry_count + 1}/{self.max_retries}): {e}"
+                        )
+                        return msg.id, str(e)[:500]
+                    return msg.id, None
+
+            # Aggregates publish concurrently with each other, but one
+            # aggregate's messages go out strictly in created_at order,
+            # stopping at the first failure so later events never
+            # overtake a failed one
+            by_aggregate: dict[UUID, list[OutboxMessage]] = {}
+            for msg in messages:
+                by_aggregate.setdefault(msg.aggregate_id, []).append(msg)
+
+            async def _publish_aggregate(
+                msgs: list[OutboxMessage],
+            ) -> list[tuple[UUID, str | None]]:
+                outcomes = []
+                for msg in msgs:
+                    outcome = await _publish_one(msg)
+                    outcomes.append(outcome)
+                    if outcome[1] is not None:
+                        break
+                return outcomes
+
+            nested = await asyncio.gather(
+                *(_publish_aggregate(msgs) for msgs in by_aggregate.values())
+            )
+            results = [outcome for outcomes in nested for outcome in outcomes]
+
+            # Bulk-mark outcomes: one UPDATE ... WHERE id IN (...) for the
+            # successes and one executemany UPDATE for failures, instead of
+            # letting dirty-tracking emit a statement per row at commit
+            success_ids = [mid for mid, err in results if err is None]
+            failures = [{"b_id": mid, "b_err": err} for mid, err in results if err is not None]
+            published_count = len(success_ids)
+
+            if success_ids:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(success_ids))
+                    .values(published_at=datetime.now(UTC))
+                )
+            if failures:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id == bindparam("b_id"))
+                    .values(
+                        retry_count=OutboxMessage.retry_count + 1,
+                        last_error=bindparam("b_err"),
+                    ),
+                    failures,
+                )
 
             await session.commit()
 
@@ -273,22 +457,30 @@ async def cleanup_published(
     older_than_days: int = 7,
     batch_size: int = 10000,
 ) -> int:
-    """Delete published messages older than specified days."""
+    """Delete published messages older than specified days.
+
+    Deletes in CTID-limited chunks: each transaction touches at most
+    batch_size rows, so locks stay short, WAL stays smooth, and vacuum
+    can keep up — an unbounded DELETE on a large outbox would hold a
+    huge lock and bloat the WAL in one go.
+    """
     from datetime import timedelta
 
-    cutoff = datetime.now(datetime.UTC) - timedelta(days=older_than_days)
+    cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
     total_deleted = 0
 
+    chunk_stmt = text(
+        "DELETE FROM outbox WHERE ctid IN ("
+        "  SELECT ctid FROM outbox"
+        "  WHERE published_at IS NOT NULL AND published_at < :cutoff"
+        "  LIMIT :batch_size"
+        ")"
+    )
+
     while True:
-        stmt = (
-            delete(OutboxMessage)
-            .where(OutboxMessage.published_at.isnot(None))
-            .where(OutboxMessage.published_at < cutoff)
+        result = await session.execute(
+            chunk_stmt, {"cutoff": cutoff, "batch_size": batch_size}
         )
-        # Note: LIMIT on DELETE requires database-specific syntax
-        # For PostgreSQL, use CTID-based deletion or a subquery
-
-        result = await session.execute(stmt)
         await session.commit()
 
         deleted = result.rowcount
@@ -297,7 +489,8 @@ async def cleanup_published(
         if deleted < batch_size:
             break
 
-        await asyncio.sleep(0.1)
+        # Yield to the event loop between chunks
+        await asyncio.sleep(0)
 
     return total_deleted
 
@@ -316,9 +509,9 @@ if __name__ == "__main__":
     - Redis Streams: redis.asyncio
     """
 
-    async def mock_publish(topic: str, key: str, value: dict) -> None:
+    async def mock_publish(topic: str, key: str, value: bytes) -> None:
         """Mock publisher for testing."""
-        print(f"Published to {topic}: {key} -> {value['type']}")
+        print(f"Published to {topic}: {key} -> {value.decode()}")
 
     async def main():
         from sqlalchemy.ext.asyncio import create_async_engine
@@ -12,18 +12,47 @@ Commands:
 """
 
 import argparse
-import json
+import io
+import mmap
+import os
 import re
-import subprocess
 import sys
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+# Heavier stdlib modules (subprocess, json) are imported inside the
+# functions that need them: cmd_validate never forks git and text-mode
+# runs never emit JSON, and CLI cold-start matters in pre-commit hooks.
 
-@dataclass
+# C-accelerated JSON emission for --json; stdlib fallback keeps the
+# script dependency-free
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        import json
+
+        return json.dumps(obj)
+
+# Compiled once at import: the conventional-commit pattern runs per commit
+# (thousands of times on a long-lived branch), and the version-file
+# patterns run per candidate file
+_CONV_COMMIT_RE = re.compile(r"^(\w+)(?:\(([^)]+)\))?(!)?:\s*(.+)$")
+
+
+@dataclass(slots=True, frozen=True)
 class Commit:
-    """Represents a parsed commit."""
+    """Represents a parsed commit.
+
+    One instance per git commit — slots drops the per-instance __dict__
+    on changelog runs over large histories; frozen makes instances
+    shareable by the memoized lookups.
+    """
 
     hash: str
     type: str
@@ -33,9 +62,9 @@ class Commit:
     breaking: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Version:
-    """Semantic version representation."""
+    """Semantic version representation (immutable; bump_* return new instances)."""
 
     major: int
     minor: int
@@ -45,30 +74,12 @@ class Version:
 
     @classmethod
     def parse(cls, version_str: str) -> "Version":
-        """Parse a version string like '1.2.3' or 'v1.2.3-beta.1+build.123'."""
-        version_str = version_str.lstrip("v")
-
-        # Handle prerelease and build metadata
-        prerelease = None
-        build = None
-
-        if "+" in version_str:
-            version_str, build = version_str.split("+", 1)
+        """Parse a version string like '1.2.3' or 'v1.2.3-beta.1+build.123'.
 
-        if "-" in version_str:
-            version_str, prerelease = version_str.split("-", 1)
-
-        parts = version_str.split(".")
-        if len(parts) < 3:
-            parts.extend(["0"] * (3 - len(parts)))
-
-        return cls(
-            major=int(parts[0]),
-            minor=int(parts[1]),
-            patch=int(parts[2]),
-            prerelease=prerelease,
-            build=build,
-        )
+        Memoized: CI loops re-parse the same tag strings, and frozen
+        instances are safe to share (bump_* return new objects).
+        """
+        return _parse_version(version_str)
 
     def __str__(self) -> str:
         version = f"{self.major}.{self.minor}.{self.patch}"
@@ -88,8 +99,38 @@ class Version:
         return Version(self.major, self.minor, self.patch + 1)
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version_str: str) -> Version:
+    """Parsing core behind Version.parse; cached per distinct string."""
+    version_str = version_str.lstrip("v")
+
+    # Handle prerelease and build metadata
+    prerelease = None
+    build = None
+
+    if "+" in version_str:
+        version_str, build = version_str.split("+", 1)
+
+    if "-" in version_str:
+        version_str, prerelease = version_str.split("-", 1)
+
+    parts = version_str.split(".")
+    if len(parts) < 3:
+        parts.extend(["0"] * (3 - len(parts)))
+
+    return Version(
+        major=int(parts[0]),
+        minor=int(parts[1]),
+        patch=int(parts[2]),
+        prerelease=prerelease,
+        build=build,
+    )
+
+
 def run_git(args: list[str], cwd: Path | None = None) -> tuple[int, str]:
     """Run a git command and return exit code and output."""
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", *args],
@@ -103,84 +144,171 @@ def run_git(args: list[str], cwd: Path | None = None) -> tuple[int, str]:
         return 1, ""
 
 
-def get_current_version(cwd: Path | None = None) -> Version | None:
-    """Get current version from git tags."""
-    code, output = run_git(["describe", "--tags", "--abbrev=0"], cwd)
+# Memoized on a resolved-path key: chained subcommands (bump, then
+# changelog) would otherwise fork the same git describe / git log twice
+@lru_cache(maxsize=8)
+def _current_version_cached(cwd_str: str | None) -> Version | None:
+    code, output = run_git(["describe", "--tags", "--abbrev=0"], Path(cwd_str) if cwd_str else None)
     if code == 0 and output:
         return Version.parse(output)
     return Version(0, 0, 0)
 
 
-def get_commits_since_tag(tag: str | None, cwd: Path | None = None) -> list[Commit]:
-    """Get commits since the specified tag."""
-    if tag:
-        code, output = run_git(["log", f"{tag}..HEAD", "--format=%H|%s|%b%n---COMMIT---"], cwd)
+def get_current_version(cwd: Path | None = None) -> Version | None:
+    """Get current version from git tags."""
+    return _current_version_cached(str(cwd.resolve()) if cwd else None)
+
+
+def _parse_commit_text(commit_text: str) -> Commit | None:
+    """Parse one `%H|%s|%b` record into a Commit, or None if malformed."""
+    commit_text = commit_text.strip()
+    if not commit_text:
+        return None
+
+    first_line = commit_text.split("\n", 1)[0]
+    parts = first_line.split("|", 2)
+    if len(parts) < 2:
+        return None
+
+    commit_hash = parts[0]
+    subject = parts[1]
+    body = parts[2] if len(parts) > 2 else ""
+
+    # Parse conventional commit format: type(scope): description
+    match = _CONV_COMMIT_RE.match(subject)
+    if match:
+        commit_type = match.group(1).lower()
+        scope = match.group(2)
+        breaking = match.group(3) == "!" or "BREAKING" in body.upper()
+        description = match.group(4)
     else:
-        code, output = run_git(["log", "--format=%H|%s|%b%n---COMMIT---"], cwd)
-
-    if code != 0:
-        return []
+        commit_type = "other"
+        scope = None
+        breaking = "BREAKING" in body.upper()
+        description = subject
+
+    return Commit(
+        hash=commit_hash[:7],
+        type=commit_type,
+        scope=scope,
+        description=description,
+        body=body,
+        breaking=breaking,
+    )
+
+
+def iter_commits_since_tag(tag: str | None, cwd: Path | None = None):
+    """Yield commits since the specified tag, streaming from git.
+
+    Reads the `git log` pipe in 64KB chunks and yields each commit as its
+    delimiter arrives, so peak memory stays at one commit instead of the
+    whole log (megabytes on a long-lived branch). Closing the generator
+    early terminates the git process.
+    """
+    import subprocess
+
+    range_args = [f"{tag}..HEAD"] if tag else []
+    try:
+        proc = subprocess.Popen(
+            ["git", "log", *range_args, "--format=%H|%s|%b%n---COMMIT---"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=cwd,
+        )
+    except FileNotFoundError:
+        return
 
-    commits = []
-    for commit_text in output.split("---COMMIT---"):
-        commit_text = commit_text.strip()
-        if not commit_text:
-            continue
+    try:
+        buffer = ""
+        while True:
+            chunk = proc.stdout.read(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            *records, buffer = buffer.split("---COMMIT---")
+            for record in records:
+                commit = _parse_commit_text(record)
+                if commit is not None:
+                    yield commit
+
+        commit = _parse_commit_text(buffer)
+        if commit is not None:
+            yield commit
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+
+
+@lru_cache(maxsize=8)
+def _commits_since_tag_cached(tag: str | None, cwd_str: str | None) -> tuple[Commit, ...]:
+    return tuple(iter_commits_since_tag(tag, Path(cwd_str) if cwd_str else None))
 
-        lines = commit_text.split("\n")
-        if not lines:
-            continue
 
-        first_line = lines[0]
-        parts = first_line.split("|", 2)
-        if len(parts) < 2:
-            continue
+def get_commits_since_tag(tag: str | None, cwd: Path | None = None) -> list[Commit]:
+    """Get commits since the specified tag (memoized per tag and path)."""
+    return list(_commits_since_tag_cached(tag, str(cwd.resolve()) if cwd else None))
+
+
+get_commits_since_tag.cache_clear = _commits_since_tag_cached.cache_clear
+get_current_version.cache_clear = _current_version_cached.cache_clear
+
+
+def scan_commit_subjects_since_tag(
+    tag: str | None, cwd: Path | None = None
+) -> tuple[int, bool, bool]:
+    """Scan only commit subjects; returns (count, has_breaking, has_features).
+
+    Bump suggestion needs just the conventional-commit type and the `!`
+    breaking marker, so fetching `%s` avoids pulling full commit bodies
+    (megabytes on large repos) only to discard them. cmd_changelog still
+    uses the body-fetching iterator.
+    """
+    range_args = [f"{tag}..HEAD"] if tag else []
+    code, output = run_git(["log", *range_args, "--format=%s"], cwd)
+    if code != 0 or not output:
+        return 0, False, False
+
+    count = 0
+    has_breaking = False
+    has_features = False
+    for subject in output.split("\n"):
+        count += 1
+        match = _CONV_COMMIT_RE.match(subject)
+        if match:
+            if match.group(3) == "!":
+                has_breaking = True
+            elif match.group(1).lower() == "feat":
+                has_features = True
 
-        commit_hash = parts[0]
-        subject = parts[1]
-        body = parts[2] if len(parts) > 2 else ""
+    return count, has_breaking, has_features
 
-        # Parse conventional commit format: type(scope): description
-        match = re.match(r"^(\w+)(?:\(([^)]+)\))?(!)?:\s*(.+)$", subject)
-        if match:
-            commit_type = match.group(1).lower()
-            scope = match.group(2)
-            breaking = match.group(3) == "!" or "BREAKING" in body.upper()
-            description = match.group(4)
-        else:
-            commit_type = "other"
-            scope = None
-            breaking = "BREAKING" in body.upper()
-            description = subject
-
-        commits.append(
-            Commit(
-                hash=commit_hash[:7],
-                type=commit_type,
-                scope=scope,
-                description=description,
-                body=body,
-                breaking=breaking,
-            )
-        )
 
-    return commits
+def suggest_bump(commits) -> str:
+    """Suggest version bump type from an iterable of commits.
 
+    Single pass with an early return on the first breaking commit — a
+    streaming source (iter_commits_since_tag) gets closed there, which
+    also terminates the underlying git process.
+    """
+    has_features = False
+    for commit in commits:
+        if commit.breaking:
+            return "major"
+        if commit.type == "feat":
+            has_features = True
 
-def suggest_bump(commits: list[Commit]) -> str:
-    """Suggest version bump type based on commits."""
-    has_breaking = any(c.breaking for c in commits)
-    has_features = any(c.type == "feat" for c in commits)
+    return "minor" if has_features else "patch"
 
-    if has_breaking:
-        return "major"
-    elif has_features:
-        return "minor"
-    return "patch"
 
+def generate_changelog(commits, version: Version) -> tuple[str, int]:
+    """Generate changelog from an iterable of commits.
 
-def generate_changelog(commits: list[Commit], version: Version) -> str:
-    """Generate changelog from commits."""
+    Buckets commits in a single pass, so a streaming source (see
+    iter_commits_since_tag) never needs to be materialized. Returns the
+    rendered changelog and the number of commits consumed.
+    """
     categories = {
         "Breaking Changes": [],
         "Features": [],
@@ -202,60 +330,125 @@ def generate_changelog(commits: list[Commit], version: Version) -> str:
         "ci": "Other",
     }
 
+    commit_count = 0
     for commit in commits:
+        commit_count += 1
         if commit.breaking:
             categories["Breaking Changes"].append(commit)
         else:
             category = type_mapping.get(commit.type, "Other")
             categories[category].append(commit)
 
-    lines = [
-        f"## [{version}] - {datetime.now(UTC).strftime('%Y-%m-%d')}",
-        "",
-    ]
+    # time.strftime over gmtime skips constructing a tz-aware datetime
+    # just to format a date (and drops the datetime import entirely)
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+
+    # StringIO writes straight into one growable buffer — no intermediate
+    # line list to hold and copy during the final join on 10k-commit runs
+    buf = io.StringIO()
+    buf.write(f"## [{version}] - {today}\n\n")
 
     for category, category_commits in categories.items():
         if not category_commits:
             continue
 
-        lines.append(f"### {category}")
-        lines.append("")
+        buf.write(f"### {category}\n\n")
 
         for commit in category_commits:
-            scope_str = f"**{commit.scope}:** " if commit.scope else ""
-            lines.append(f"- {scope_str}{commit.description} ({commit.hash})")
-
-        lines.append("")
-
-    return "\n".join(lines)
+            scope = commit.scope
+            if scope:
+                buf.write(f"- **{scope}:** {commit.description} ({commit.hash})\n")
+            else:
+                buf.write(f"- {commit.description} ({commit.hash})\n")
+
+        buf.write("\n")
+
+    return buf.getvalue(), commit_count
+
+
+# (byte probe, text pattern, replacement template) triples; {v} is the new
+# version. The byte probe runs over an mmap of the file, so candidates
+# without a version string are rejected without decoding their contents.
+_VERSION_PATTERNS = (
+    (
+        re.compile(rb'"version":\s*"[^"]*"'),
+        re.compile(r'"version":\s*"[^"]*"'),
+        '"version": "{v}"',
+    ),
+    (
+        re.compile(rb"^version\s*=\s*['\"].*['\"]", re.MULTILINE),
+        re.compile(r"^version\s*=\s*['\"].*['\"]", re.MULTILINE),
+        'version = "{v}"',
+    ),
+    (
+        re.compile(rb"__version__\s*=\s*['\"].*['\"]"),
+        re.compile(r"__version__\s*=\s*['\"].*['\"]"),
+        '__version__ = "{v}"',
+    ),
+)
 
 
 def update_version_file(path: Path, version: Version) -> bool:
-    """Update version in a file."""
+    """Update version in a file.
+
+    Structured formats are parsed and rewritten directly — one targeted
+    write instead of three whole-file regex passes, and no risk of a
+    pattern matching a "version" key somewhere else in the document.
+    Regex substitution remains for setup.py / version.py style files.
+    """
     if not path.exists():
         return False
 
-    content = path.read_text()
     version_str = str(version)
 
-    # Try different patterns
-    patterns = [
-        (r'"version":\s*"[^"]*"', f'"version": "{version_str}"'),
-        (r"^version\s*=\s*['\"].*['\"]", f'version = "{version_str}"', re.MULTILINE),
-        (r"__version__\s*=\s*['\"].*['\"]", f'__version__ = "{version_str}"'),
-    ]
-
-    updated = False
-    for pattern in patterns:
-        flags = pattern[2] if len(pattern) > 2 else 0
-        if re.search(pattern[0], content, flags):
-            content = re.sub(pattern[0], pattern[1], content, flags=flags)
-            updated = True
+    if path.name == "package.json":
+        import json
+
+        try:
+            data = json.loads(path.read_text())
+        except json.JSONDecodeError:
+            return False
+        data["version"] = version_str
+        path.write_text(json.dumps(data, indent=2) + "\n")
+        return True
+
+    if path.name == "pyproject.toml":
+        try:
+            import tomlkit  # preserves formatting and comments
+        except ImportError:
+            tomlkit = None
+        if tomlkit is not None:
+            doc = tomlkit.parse(path.read_text())
+            project = doc.get("project")
+            if project is not None and "version" in project:
+                project["version"] = version_str
+                path.write_text(tomlkit.dumps(doc))
+                return True
+            return False
+        # No tomlkit: fall through to the regex patterns below
+
+    # Probe via mmap before decoding: the kernel pages the file in and the
+    # byte regexes scan it zero-copy, so a large setup.py with no version
+    # string never gets read into a Python str at all
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            to_apply = [
+                (text_pattern, template)
+                for byte_probe, text_pattern, template in _VERSION_PATTERNS
+                if byte_probe.search(mm)
+            ]
+    except (OSError, ValueError):
+        # Empty files cannot be mapped (and contain no version string)
+        return False
 
-    if updated:
-        path.write_text(content)
+    if not to_apply:
+        return False
 
-    return updated
+    content = path.read_text()
+    for pattern, template in to_apply:
+        content = pattern.sub(template.format(v=version_str), content)
+    path.write_text(content)
+    return True
 
 
 def find_version_files(cwd: Path) -> list[Path]:
@@ -269,13 +462,13 @@ def find_version_files(cwd: Path) -> list[Path]:
         "__version__.py",
     ]
 
-    found = []
-    for candidate in candidates:
-        path = cwd / candidate
-        if path.exists():
-            found.append(path)
+    # One directory read instead of a stat() per candidate
+    try:
+        present = {e.name for e in os.scandir(cwd) if e.is_file()}
+    except OSError:
+        return []
 
-    return found
+    return [cwd / candidate for candidate in candidates if candidate in present]
 
 
 def cmd_current(args: argparse.Namespace) -> int:
@@ -285,7 +478,7 @@ def cmd_current(args: argparse.Namespace) -> int:
 
     if args.json:
         print(
-            json.dumps(
+            _dumps(
                 {
                     "version": str(version) if version else None,
                     "major": version.major if version else 0,
@@ -305,13 +498,13 @@ def cmd_bump(args: argparse.Namespace) -> int:
     cwd = Path(args.path).resolve()
     current = get_current_version(cwd) or Version(0, 0, 0)
 
-    # Get commits to analyze
+    # Subject-only scan: enough for the bump decision without fetching bodies
     current_tag = f"v{current}" if current.major > 0 or current.minor > 0 or current.patch > 0 else None
-    commits = get_commits_since_tag(current_tag, cwd)
+    commit_count, has_breaking, has_features = scan_commit_subjects_since_tag(current_tag, cwd)
 
     bump_type = args.type
     if bump_type == "auto":
-        bump_type = suggest_bump(commits)
+        bump_type = "major" if has_breaking else ("minor" if has_features else "patch")
 
     if bump_type == "major":
         new_version = current.bump_major()
@@ -322,14 +515,14 @@ def cmd_bump(args: argparse.Namespace) -> int:
 
     if args.json:
         print(
-            json.dumps(
+            _dumps(
                 {
                     "current": str(current),
                     "new": str(new_version),
                     "bump_type": bump_type,
-                    "commits_analyzed": len(commits),
-                    "has_breaking": any(c.breaking for c in commits),
-                    "has_features": any(c.type == "feat" for c in commits),
+                    "commits_analyzed": commit_count,
+                    "has_breaking": has_breaking,
+                    "has_features": has_features,
                 }
             )
         )
@@ -337,7 +530,7 @@ def cmd_bump(args: argparse.Namespace) -> int:
         print(f"Current version: v{current}")
         print(f"Bump type: {bump_type}")
         print(f"New version: v{new_version}")
-        print(f"\nCommits analyzed: {len(commits)}")
+        print(f"\nCommits analyzed: {commit_count}")
 
         if not args.dry_run:
             # Update version files
@@ -363,20 +556,20 @@ def cmd_changelog(args: argparse.Namespace) -> int:
     version = Version.parse(args.version) if args.version else current.bump_patch()
 
     current_tag = f"v{current}" if current.major > 0 or current.minor > 0 or current.patch > 0 else None
-    commits = get_commits_since_tag(current_tag, cwd)
+    changelog, commit_count = generate_changelog(
+        iter_commits_since_tag(current_tag, cwd), version
+    )
 
-    if not commits:
+    if commit_count == 0:
         print("No commits found since last release", file=sys.stderr)
         return 1
 
-    changelog = generate_changelog(commits, version)
-
     if args.json:
         print(
-            json.dumps(
+            _dumps(
                 {
                     "version": str(version),
-                    "commits": len(commits),
+                    "commits": commit_count,
                     "changelog": changelog,
                 }
             )
@@ -393,7 +586,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
         version = Version.parse(args.version)
         if args.json:
             print(
-                json.dumps(
+                _dumps(
                     {
                         "valid": True,
                         "version": str(version),
@@ -410,7 +603,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
         return 0
     except (ValueError, IndexError) as e:
         if args.json:
-            print(json.dumps({"valid": False, "error": str(e)}))
+            print(_dumps({"valid": False, "error": str(e)}))
         else:
             print(f"Invalid: {e}", file=sys.stderr)
         return 1
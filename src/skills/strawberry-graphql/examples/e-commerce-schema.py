@@ -10,6 +10,13 @@ Complete schema for an e-commerce application with:
 - Authentication and authorization
 """
 
+import asyncio
+import contextvars
+import dataclasses
+from functools import partial
+from itertools import groupby
+from operator import attrgetter
+
 import strawberry
 from strawberry import Private
 from strawberry.types import Info
@@ -18,9 +25,13 @@ from strawberry.permission import BasePermission
 from datetime import datetime
 from decimal import Decimal
 from typing import Sequence
-from collections import defaultdict
 from enum import Enum
 
+# Shared sentinel for keys with no rows: GraphQL list fields never mutate
+# the returned sequence, so every miss can alias one tuple instead of
+# allocating a fresh empty list per key
+_EMPTY: tuple = ()
+
 
 # =============================================================================
 # ENUMS
@@ -73,6 +84,10 @@ class PageInfo:
     end_cursor: str | None = None
 
 
+# Currency symbols for Money.formatted; unknown codes render as "EUR 1.00"
+_CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
+
+
 @strawberry.type
 class Money:
     """Monetary amount with currency."""
@@ -82,8 +97,15 @@ class Money:
     @strawberry.field
     def formatted(self) -> str:
         """Return formatted string like '$19.99'."""
-        dollars = self.amount / 100
-        return f"${dollars:.2f}"
+        # Pure-integer divmod: no float round-trip (and no precision
+        # risk), and {:02d} on a small int hits CPython's fast path.
+        # Called once per price in cart/order lists. divmod on the
+        # magnitude with the sign split out keeps refunds/credits
+        # rendering as '-$19.99' rather than '$-20.01'.
+        sign = "-" if self.amount < 0 else ""
+        dollars, cents = divmod(abs(self.amount), 100)
+        symbol = _CURRENCY_SYMBOLS.get(self.currency) or f"{self.currency} "
+        return f"{sign}{symbol}{dollars}.{cents:02d}"
 
 
 # =============================================================================
@@ -395,6 +417,12 @@ class AddressInput:
     is_default: bool = False
 
 
+# Declared field names resolved once at import; add_address forwards
+# exactly these instead of unpacking input.__dict__, which copies the
+# whole attribute dict and leaks any framework-set private attrs
+_ADDRESS_FIELDS = tuple(f.name for f in dataclasses.fields(AddressInput))
+
+
 @strawberry.input
 class CartItemInput:
     product_id: strawberry.ID
@@ -479,78 +507,228 @@ class IsAdmin(BasePermission):
 # DATALOADERS
 # =============================================================================
 
+# Cap keys per batch so each repo call stays one well-shaped SQL IN
+# query; planners degrade on multi-thousand-element IN lists, and the
+# coalescer still overlaps any overflow batches in the same gather
+_MAX_BATCH_SIZE = 200
+
+
+class BatchCoalescer:
+    """Second-layer batching across DataLoaders.
+
+    DataLoader batches keys within a single loader, but a query fanning
+    out over five loaders still issues five independent repo round-trips
+    per tick. Loaders route their batch fetch through here instead: the
+    first fetch in a tick schedules one flush on the next loop
+    iteration, and the flush runs every pending repo call in a single
+    asyncio.gather, so the round-trips overlap instead of resolving one
+    loader at a time. Create one per request, like the loaders.
+    """
+
+    def __init__(self):
+        self._pending: list[tuple] = []
+        self._flush_scheduled = False
+
+    def fetch(self, fetch_fn, keys: list[str]) -> "asyncio.Future":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((fetch_fn, keys, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(lambda: loop.create_task(self._flush()))
+        return future
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._flush_scheduled = False
+        results = await asyncio.gather(
+            *(fetch_fn(keys) for fetch_fn, keys, _ in pending),
+            return_exceptions=True,
+        )
+        for (_, _, future), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _coalesced(coalescer: BatchCoalescer | None, fetch_fn, keys: list[str]):
+    """Fetch through the per-request coalescer when one is wired."""
+    if coalescer is None:
+        return await fetch_fn(keys)
+    return await coalescer.fetch(fetch_fn, keys)
+
+
 class CategoryLoader(DataLoader[str, Category]):
-    def __init__(self, repo):
-        super().__init__(load_fn=self.batch_load)
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
+        super().__init__(load_fn=self.batch_load, max_batch_size=_MAX_BATCH_SIZE)
         self.repo = repo
+        self._coalescer = coalescer
 
     async def batch_load(self, keys: list[str]) -> Sequence[Category | None]:
-        categories = await self.repo.get_many(keys)
+        categories = await _coalesced(self._coalescer, self.repo.get_many, keys)
         cat_map = {str(c.id): c for c in categories}
         return [cat_map.get(k) for k in keys]
 
 
 class ProductLoader(DataLoader[str, Product]):
-    def __init__(self, repo):
-        super().__init__(load_fn=self.batch_load)
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
+        super().__init__(load_fn=self.batch_load, max_batch_size=_MAX_BATCH_SIZE)
         self.repo = repo
+        self._coalescer = coalescer
 
     async def batch_load(self, keys: list[str]) -> Sequence[Product | None]:
-        products = await self.repo.get_many(keys)
+        products = await _coalesced(self._coalescer, self.repo.get_many, keys)
         prod_map = {str(p.id): p for p in products}
         return [prod_map.get(k) for k in keys]
 
 
 class ProductImagesLoader:
-    def __init__(self, repo):
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
         self.repo = repo
-        self._loader = DataLoader(load_fn=self._batch_load)
+        self._coalescer = coalescer
+        self._loader = DataLoader(
+            load_fn=self._batch_load, max_batch_size=_MAX_BATCH_SIZE
+        )
 
     async def load(self, product_id: str) -> list[ProductImage]:
         return await self._loader.load(product_id)
 
     async def _batch_load(self, keys: list[str]) -> Sequence[list[ProductImage]]:
-        images = await self.repo.get_images_for_products(keys)
-        images_by_product: dict[str, list] = defaultdict(list)
+        images = await _coalesced(
+            self._coalescer, self.repo.get_images_for_products, keys
+        )
+        images_by_product: dict[str, list] = {}
         for img in images:
-            images_by_product[str(img.product_id)].append(img)
-        return [images_by_product.get(k, []) for k in keys]
+            images_by_product.setdefault(str(img.product_id), []).append(img)
+        return [images_by_product.get(k) or _EMPTY for k in keys]
+
+
+class ProductVariantsLoader:
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
+        self.repo = repo
+        self._coalescer = coalescer
+        self._loader = DataLoader(
+            load_fn=self._batch_load, max_batch_size=_MAX_BATCH_SIZE
+        )
+
+    async def load(self, product_id: str) -> list[ProductVariant]:
+        return await self._loader.load(product_id)
+
+    async def _batch_load(self, keys: list[str]) -> Sequence[list[ProductVariant]]:
+        variants = await _coalesced(
+            self._coalescer, self.repo.get_variants_for_products, keys
+        )
+        variants_by_product: dict[str, list] = {}
+        for variant in variants:
+            variants_by_product.setdefault(str(variant.product_id), []).append(variant)
+        return [variants_by_product.get(k) or _EMPTY for k in keys]
 
 
 class OrderItemsLoader:
-    def __init__(self, repo):
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
         self.repo = repo
-        self._loader = DataLoader(load_fn=self._batch_load)
+        self._coalescer = coalescer
+        self._loader = DataLoader(
+            load_fn=self._batch_load, max_batch_size=_MAX_BATCH_SIZE
+        )
 
     async def load(self, order_id: str) -> list[OrderItem]:
         return await self._loader.load(order_id)
 
     async def _batch_load(self, keys: list[str]) -> Sequence[list[OrderItem]]:
-        items = await self.repo.get_items_for_orders(keys)
-        items_by_order: dict[str, list] = defaultdict(list)
+        items = await _coalesced(
+            self._coalescer, self.repo.get_items_for_orders, keys
+        )
+        items_by_order: dict[str, list] = {}
         for item in items:
-            items_by_order[str(item.order_id)].append(item)
-        return [items_by_order.get(k, []) for k in keys]
+            items_by_order.setdefault(str(item.order_id), []).append(item)
+        return [items_by_order.get(k) or _EMPTY for k in keys]
+
+
+# Optional NumPy fast path for review aggregation; the pure-Python
+# fallback keeps the example dependency-free
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def compute_rating_distribution(ratings: Sequence[int]) -> str:
+    """Histogram 1-5 star ratings into the ReviewsSummary JSON shape.
+
+    For repos backing ReviewsSummaryLoader from raw review rows: with
+    NumPy a 10k-review product is one C-level bincount pass instead of
+    10k interpreter iterations.
+    """
+    if np is not None:
+        counts = np.bincount(np.asarray(ratings, dtype=np.int8), minlength=6)[1:6]
+    else:
+        counts = [0] * 5
+        for rating in ratings:
+            if 1 <= rating <= 5:
+                counts[rating - 1] += 1
+    return (
+        "{"
+        + ", ".join(f'"{star}": {int(counts[star - 1])}' for star in (5, 4, 3, 2, 1))
+        + "}"
+    )
 
 
 class ReviewsSummaryLoader:
-    def __init__(self, repo):
+    def __init__(self, repo, coalescer: BatchCoalescer | None = None):
         self.repo = repo
-        self._loader = DataLoader(load_fn=self._batch_load)
+        self._coalescer = coalescer
+        self._loader = DataLoader(
+            load_fn=self._batch_load, max_batch_size=_MAX_BATCH_SIZE
+        )
 
     async def load(self, product_id: str) -> ReviewsSummary:
         return await self._loader.load(product_id)
 
     async def _batch_load(self, keys: list[str]) -> Sequence[ReviewsSummary]:
-        summaries = await self.repo.get_reviews_summaries(keys)
-        summary_map = {str(s.product_id): s for s in summaries}
-        default = ReviewsSummary(
-            product_id="",
-            average_rating=0.0,
-            total_reviews=0,
-            rating_distribution="{}",
+        # Raw ratings in, summaries out: the repo returns one rating list
+        # per product and the aggregation happens here, so the histogram
+        # vectorizes under NumPy instead of the repo pre-aggregating row
+        # by row
+        ratings_per_product = await _coalesced(
+            self._coalescer, self.repo.get_ratings_for_products, keys
         )
-        return [summary_map.get(k, default) for k in keys]
+        summaries = []
+        for key, ratings in zip(keys, ratings_per_product):
+            total = len(ratings)
+            summaries.append(
+                ReviewsSummary(
+                    product_id=key,
+                    average_rating=(
+                        round(sum(ratings) / total, 2) if total else 0.0
+                    ),
+                    total_reviews=total,
+                    rating_distribution=compute_rating_distribution(ratings),
+                )
+            )
+        return summaries
+
+
+# Context-scoped loader pool: ASGI servers run each request in its own
+# contextvars context, so every request sees a private dict and loaders
+# (with their caches and coalescer) are never shared between concurrent
+# requests. Within one request-context, repeated lookups reuse the same
+# instance instead of re-allocating loader plus load_fn closure.
+_LOADER_POOL: contextvars.ContextVar[dict[type, object] | None] = (
+    contextvars.ContextVar("loader_pool", default=None)
+)
+
+
+def _pooled(cls, repo, coalescer: BatchCoalescer):
+    pool = _LOADER_POOL.get()
+    if pool is None:
+        pool = {}
+        _LOADER_POOL.set(pool)
+    loader = pool.get(cls)
+    if loader is None:
+        loader = pool[cls] = cls(repo, coalescer)
+    return loader
 
 
 # =============================================================================
@@ -629,7 +807,7 @@ class Query:
 
     @strawberry.field(permission_classes=[IsAuthenticated])
     async def order(self, info: Info, id: strawberry.ID) -> Order | None:
-        order = await info.context.order_service.get(id)
+        order = await info.context.get_order(id)
         if order and order.user_id != info.context.current_user_id:
             if not info.context.is_admin:
                 raise PermissionError("Cannot view other user's order")
@@ -648,26 +826,32 @@ class Mutation:
         info: Info,
         input: CreateOrderInput,
     ) -> CreateOrderResult:
-        errors = []
-
-        # Validate items
+        # Validate items. Short-circuit the empty cart, then one
+        # comprehension pass that allocates nothing on the all-valid hot
+        # path; FieldErrors are only built when something is wrong
         if not input.items:
-            errors.append(FieldError(
-                field="items",
-                message="Order must have at least one item",
-                code="EMPTY_ORDER",
-            ))
-
-        for item in input.items:
-            if item.quantity < 1:
-                errors.append(FieldError(
+            return MutationError(
+                message="Validation failed",
+                errors=[FieldError(
                     field="items",
-                    message=f"Invalid quantity for product {item.product_id}",
-                    code="INVALID_QUANTITY",
-                ))
+                    message="Order must have at least one item",
+                    code="EMPTY_ORDER",
+                )],
+            )
 
-        if errors:
-            return MutationError(message="Validation failed", errors=errors)
+        bad = [item.product_id for item in input.items if item.quantity < 1]
+        if bad:
+            return MutationError(
+                message="Validation failed",
+                errors=[
+                    FieldError(
+                        field="items",
+                        message=f"Invalid quantity for product {product_id}",
+                        code="INVALID_QUANTITY",
+                    )
+                    for product_id in bad
+                ],
+            )
 
         try:
             order = await info.context.order_service.create(
@@ -681,13 +865,75 @@ class Mutation:
         except Exception as e:
             return MutationError(message=str(e))
 
+    @strawberry.mutation(permission_classes=[IsAuthenticated])
+    async def create_orders(
+        self,
+        info: Info,
+        inputs: list[CreateOrderInput],
+    ) -> list[CreateOrderResult]:
+        """Batch variant of create_order: list in, list out.
+
+        Auth, permission checks and context setup are paid once for the
+        whole batch, and all valid orders go to the service in a single
+        create_many call (one multi-row insert) instead of N mutations.
+        Results are positionally parallel to ``inputs``.
+        """
+        results: list = [None] * len(inputs)
+        valid: list[tuple[int, CreateOrderInput]] = []
+
+        for idx, order_input in enumerate(inputs):
+            if not order_input.items:
+                results[idx] = MutationError(
+                    message="Validation failed",
+                    errors=[FieldError(
+                        field="items",
+                        message="Order must have at least one item",
+                        code="EMPTY_ORDER",
+                    )],
+                )
+                continue
+            bad = [
+                item.product_id
+                for item in order_input.items
+                if item.quantity < 1
+            ]
+            if bad:
+                results[idx] = MutationError(
+                    message="Validation failed",
+                    errors=[
+                        FieldError(
+                            field="items",
+                            message=f"Invalid quantity for product {product_id}",
+                            code="INVALID_QUANTITY",
+                        )
+                        for product_id in bad
+                    ],
+                )
+                continue
+            valid.append((idx, order_input))
+
+        if valid:
+            try:
+                orders = await info.context.order_service.create_many(
+                    user_id=info.context.current_user_id,
+                    inputs=[order_input for _, order_input in valid],
+                )
+                for (idx, _), order in zip(valid, orders):
+                    results[idx] = CreateOrderSuccess(order=order)
+            except Exception as e:
+                failure = MutationError(message=str(e))
+                for idx, _ in valid:
+                    results[idx] = failure
+
+        return results
+
     @strawberry.mutation(permission_classes=[IsAuthenticated])
     async def cancel_order(
         self,
         info: Info,
         order_id: strawberry.ID,
     ) -> Order:
-        order = await info.context.order_service.get(order_id)
+        order = await info.context.get_order(order_id)
         if not order:
             raise ValueError("Order not found")
         if order.user_id != info.context.current_user_id:
@@ -695,7 +941,9 @@ class Mutation:
         if order.status not in [OrderStatus.PENDING, OrderStatus.CONFIRMED]:
             raise ValueError("Order cannot be cancelled")
 
-        return await info.context.order_service.cancel(order_id)
+        cancelled = await info.context.order_service.cancel(order_id)
+        info.context.invalidate_order(order_id)
+        return cancelled
 
     @strawberry.mutation(permission_classes=[IsAuthenticated])
     async def add_address(
@@ -705,7 +953,7 @@ class Mutation:
     ) -> Address:
         return await info.context.user_service.add_address(
             user_id=info.context.current_user_id,
-            **input.__dict__,
+            **{name: getattr(input, name) for name in _ADDRESS_FIELDS},
         )
 
     @strawberry.mutation(permission_classes=[IsAuthenticated])
@@ -714,30 +962,39 @@ class Mutation:
         info: Info,
         input: CreateReviewInput,
     ) -> CreateReviewResult:
-        errors = []
-
-        if input.rating < 1 or input.rating > 5:
-            errors.append(FieldError(
-                field="rating",
-                message="Rating must be between 1 and 5",
-                code="INVALID_RATING",
-            ))
-
-        if len(input.title) < 3:
-            errors.append(FieldError(
-                field="title",
-                message="Title must be at least 3 characters",
-                code="TITLE_TOO_SHORT",
-            ))
-
-        if errors:
+        # Kick off the purchase check immediately so its round-trip
+        # overlaps validation and any other per-request prep instead of
+        # running after them
+        purchased_task = asyncio.create_task(
+            info.context.order_service.user_has_purchased(
+                user_id=info.context.current_user_id,
+                product_id=input.product_id,
+            )
+        )
+
+        # One combined short-circuit test keeps the valid-input hot path
+        # free of list and FieldError allocations; the detailed errors are
+        # only assembled once we know validation failed
+        rating_bad = input.rating < 1 or input.rating > 5
+        if rating_bad or len(input.title) < 3:
+            purchased_task.cancel()
+            errors = []
+            if rating_bad:
+                errors.append(FieldError(
+                    field="rating",
+                    message="Rating must be between 1 and 5",
+                    code="INVALID_RATING",
+                ))
+            if len(input.title) < 3:
+                errors.append(FieldError(
+                    field="title",
+                    message="Title must be at least 3 characters",
+                    code="TITLE_TOO_SHORT",
+                ))
             return MutationError(message="Validation failed", errors=errors)
 
-        # Check if user has purchased the product
-        has_purchased = await info.context.order_service.user_has_purchased(
-            user_id=info.context.current_user_id,
-            product_id=input.product_id,
-        )
+        # Result is needed only now, just before persistence
+        has_purchased = await purchased_task
 
         review = await info.context.review_service.create(
             user_id=info.context.current_user_id,
@@ -749,6 +1006,64 @@ class Mutation:
         )
         return CreateReviewSuccess(review=review)
 
+    @strawberry.mutation(permission_classes=[IsAuthenticated])
+    async def create_reviews(
+        self,
+        info: Info,
+        inputs: list[CreateReviewInput],
+    ) -> list[CreateReviewResult]:
+        """Batch variant of create_review: list in, list out.
+
+        Purchase verification runs as one user_has_purchased_many call
+        and persistence as one create_many insert, so a bulk client pays
+        two round-trips total instead of two per review. Results are
+        positionally parallel to ``inputs``.
+        """
+        results: list = [None] * len(inputs)
+        valid: list[tuple[int, CreateReviewInput]] = []
+
+        for idx, review_input in enumerate(inputs):
+            rating_bad = review_input.rating < 1 or review_input.rating > 5
+            if rating_bad or len(review_input.title) < 3:
+                errors = []
+                if rating_bad:
+                    errors.append(FieldError(
+                        field="rating",
+                        message="Rating must be between 1 and 5",
+                        code="INVALID_RATING",
+                    ))
+                if len(review_input.title) < 3:
+                    errors.append(FieldError(
+                        field="title",
+                        message="Title must be at least 3 characters",
+                        code="TITLE_TOO_SHORT",
+                    ))
+                results[idx] = MutationError(
+                    message="Validation failed", errors=errors
+                )
+                continue
+            valid.append((idx, review_input))
+
+        if valid:
+            try:
+                purchased = await info.context.order_service.user_has_purchased_many(
+                    user_id=info.context.current_user_id,
+                    product_ids=[ri.product_id for _, ri in valid],
+                )
+                reviews = await info.context.review_service.create_many(
+                    user_id=info.context.current_user_id,
+                    inputs=[ri for _, ri in valid],
+                    verified_purchases=purchased,
+                )
+                for (idx, _), review in zip(valid, reviews):
+                    results[idx] = CreateReviewSuccess(review=review)
+            except Exception as e:
+                failure = MutationError(message=str(e))
+                for idx, _ in valid:
+                    results[idx] = failure
+
+        return results
+
 
 # =============================================================================
 # SCHEMA
@@ -794,35 +1109,89 @@ class ECommerceContext:
         self.user_service = user_service
         self.review_service = review_service
 
-        # DataLoaders (created per request)
-        self.product_loader = ProductLoader(product_repo)
-        self.category_loader = CategoryLoader(category_repo)
-        self.user_loader = DataLoader(load_fn=self._load_users)
-        self.product_images_loader = ProductImagesLoader(product_repo)
-        self.product_variants_loader = ProductImagesLoader(product_repo)  # Similar pattern
-        self.order_items_loader = OrderItemsLoader(order_repo)
-        self.reviews_summary_loader = ReviewsSummaryLoader(review_repo)
-        self.category_children_loader = DataLoader(load_fn=self._load_category_children)
-        self.user_addresses_loader = DataLoader(load_fn=self._load_user_addresses)
+        # DataLoaders (created per request), sharing one coalescer so
+        # each tick's batch reads go out in a single gather
+        self._coalescer = BatchCoalescer()
+        self.product_loader = _pooled(ProductLoader, product_repo, self._coalescer)
+        self.category_loader = _pooled(CategoryLoader, category_repo, self._coalescer)
+        # The three context-bound loaders below capture per-request
+        # context methods as their load_fn, so they stay request-scoped
+        self.user_loader = DataLoader(
+            load_fn=self._load_users, max_batch_size=_MAX_BATCH_SIZE
+        )
+        self.product_images_loader = _pooled(
+            ProductImagesLoader, product_repo, self._coalescer
+        )
+        self.product_variants_loader = _pooled(
+            ProductVariantsLoader, product_repo, self._coalescer
+        )
+        self.order_items_loader = _pooled(
+            OrderItemsLoader, order_repo, self._coalescer
+        )
+        self.reviews_summary_loader = _pooled(
+            ReviewsSummaryLoader, review_repo, self._coalescer
+        )
+        self.category_children_loader = DataLoader(
+            load_fn=self._load_category_children, max_batch_size=_MAX_BATCH_SIZE
+        )
+        self.user_addresses_loader = DataLoader(
+            load_fn=self._load_user_addresses, max_batch_size=_MAX_BATCH_SIZE
+        )
 
         self._user_repo = user_repo
         self._category_repo = category_repo
 
+        # Request-scoped order fetches: multiple resolvers/mutations asking
+        # for the same order in one request share a single in-flight task
+        self._order_cache: dict[str, asyncio.Task] = {}
+
+    def get_order(self, order_id: str) -> "asyncio.Task":
+        """Fetch an order, deduplicated per request.
+
+        Promise-style caching (same idea as DataLoader): the first caller
+        starts the order_service.get task, later callers await the same
+        task, so each distinct order id costs one round-trip per request.
+        """
+        task = self._order_cache.get(order_id)
+        if task is None:
+            task = asyncio.ensure_future(self.order_service.get(order_id))
+            self._order_cache[order_id] = task
+        return task
+
+    def invalidate_order(self, order_id: str) -> None:
+        """Drop a cached order after a mutation changes it."""
+        self._order_cache.pop(order_id, None)
+
     async def _load_users(self, keys: list[str]) -> Sequence:
-        users = await self._user_repo.get_many(keys)
+        users = await _coalesced(self._coalescer, self._user_repo.get_many, keys)
         user_map = {str(u.id): u for u in users}
         return [user_map.get(k) for k in keys]
 
     async def _load_category_children(self, keys: list[str]) -> Sequence[list]:
-        children = await self._category_repo.get_children_for_categories(keys)
-        children_map: dict[str, list] = defaultdict(list)
-        for child in children:
-            children_map[str(child.parent_id)].append(child)
-        return [children_map.get(k, []) for k in keys]
+        # order_by pushes sorting into SQL, so grouping becomes one
+        # C-level groupby pass instead of a Python setdefault loop
+        children = await _coalesced(
+            self._coalescer,
+            partial(
+                self._category_repo.get_children_for_categories,
+                order_by="parent_id",
+            ),
+            keys,
+        )
+        children_map = {
+            str(parent_id): list(group)
+            for parent_id, group in groupby(children, key=attrgetter("parent_id"))
+        }
+        return [children_map.get(k) or _EMPTY for k in keys]
 
     async def _load_user_addresses(self, keys: list[str]) -> Sequence[list]:
-        addresses = await self._user_repo.get_addresses_for_users(keys)
-        addr_map: dict[str, list] = defaultdict(list)
-        for addr in addresses:
-            addr_map[str(addr.user_id)].append(addr)
-        return [addr_map.get(k, []) for k in keys]
+        addresses = await _coalesced(
+            self._coalescer,
+            partial(self._user_repo.get_addresses_for_users, order_by="user_id"),
+            keys,
+        )
+        addr_map = {
+            str(user_id): list(group)
+            for user_id, group in groupby(addresses, key=attrgetter("user_id"))
+        }
+        return [addr_map.get(k) or _EMPTY for k in keys]
@@ -30,9 +30,20 @@ Output:
 └────────────────────────────────────────────────────┘
 """
 
+import functools
 import json
+import shutil
 import sys
-from typing import Any
+from typing import Any, TextIO
+
+# orjson parses multi-MB task dumps 2-5x faster and straight from bytes;
+# stdlib json is a drop-in fallback (it accepts bytes too). Both raise a
+# ValueError subclass on bad input.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 def status_icon(status: str) -> str:
@@ -61,85 +72,176 @@ def build_tree(tasks: list[dict[str, Any]]) -> dict[str, list[str]]:
     return tree
 
 
+@functools.lru_cache(maxsize=16)
+def _build_tree_cached(
+    task_json: str | bytes,
+) -> tuple[list[dict[str, Any]], dict[str, list[str]]]:
+    """Parse tasks and build the adjacency list, memoized on the raw JSON.
+
+    One-shot CLI runs pay nothing extra; library callers rendering the
+    same task list repeatedly (diff views, --watch loops) skip the
+    re-parse and rebuild. Returned structures are shared between cache
+    hits and must not be mutated.
+    """
+    data = _loads(task_json)
+    tasks = data.get("tasks", data) if isinstance(data, dict) else data
+    return tasks, build_tree(tasks)
+
+
 def render_tree(
-    tasks: list[dict[str, Any]],
+    label_by_id: dict[str, str],
     tree: dict[str, list[str]],
+    out: Any,  # list[str] or anything else with append(str)
     node: str = "ROOT",
     prefix: str = "",
-    visited: set[str] | None = None,
-) -> list[str]:
-    """Render tree as ASCII lines."""
-    if visited is None:
-        visited = set()
+) -> None:
+    """Render tree as ASCII lines into ``out`` using an explicit DFS stack.
+
+    Iterative traversal avoids per-level frame setup and the
+    RecursionError failure mode on deep dependency chains; appending to
+    the caller's list means no intermediate lists are allocated or
+    merged.
+    """
+    on_path: set[str] = set()
+
+    # Stack entries are (child_id, prefix, connector, child_prefix);
+    # a (None, child_id, ...) sentinel pops the id off the current path
+    # once its subtree is done, preserving the cycle guard.
+    stack: list[tuple[str | None, str, str, str]] = []
+
+    def push_children(parent: str, parent_prefix: str) -> None:
+        children = tree.get(parent, [])
+        last = len(children) - 1
+        # Reverse push so pop order matches the visual top-to-bottom order
+        for i in range(last, -1, -1):
+            is_last = i == last
+            connector = "└─" if is_last else "├─"
+            child_prefix = parent_prefix + ("   " if is_last else "│  ")
+            stack.append((children[i], parent_prefix, connector, child_prefix))
 
-    lines: list[str] = []
-    children = tree.get(node, [])
+    push_children(node, prefix)
 
-    for i, child_id in enumerate(children):
-        is_last = i == len(children) - 1
-        task = next((t for t in tasks if t["id"] == child_id), None)
+    while stack:
+        child_id, pfx, connector, child_prefix = stack.pop()
 
-        if task is None:
+        if child_id is None:
+            on_path.discard(pfx)
             continue
 
-        # Prevent infinite loops from circular dependencies
-        if child_id in visited:
-            connector = "└─" if is_last else "├─"
-            lines.append(f"{prefix}{connector}→ #{child_id} (circular ref)")
+        label = label_by_id.get(child_id)
+        if label is None:
             continue
 
-        visited.add(child_id)
-
-        connector = "└─" if is_last else "├─"
-        status = status_icon(task.get("status", "pending"))
-        subject = task.get("subject", "Untitled")[:40]
-
-        lines.append(f"{prefix}{connector}→ #{child_id} {status} {subject}")
+        # Prevent infinite loops from circular dependencies. on_path tracks
+        # only the current root-to-node chain, so a DAG node may still
+        # render under multiple parents.
+        if child_id in on_path:
+            out.append(f"{pfx}{connector}→ #{child_id} (circular ref)")
+            continue
 
-        # Recurse to children
-        child_prefix = prefix + ("   " if is_last else "│  ")
-        lines.extend(
-            render_tree(tasks, tree, child_id, child_prefix, visited.copy())
-        )
+        out.append(f"{pfx}{connector}→ {label}")
 
-    return lines
+        on_path.add(child_id)
+        stack.append((None, child_id, "", ""))
+        push_children(child_id, child_prefix)
 
 
-def visualize(task_json: str) -> str:
+def visualize(task_json: str | bytes) -> str:
     """Generate ASCII visualization from JSON."""
     try:
-        data = json.loads(task_json)
-        tasks = data.get("tasks", data) if isinstance(data, dict) else data
-    except json.JSONDecodeError as e:
+        tasks, tree = _build_tree_cached(task_json)
+    except ValueError as e:
         return f"Error parsing JSON: {e}"
 
     if not tasks:
         return "No tasks to visualize"
 
-    tree = build_tree(tasks)
-    lines = render_tree(tasks, tree)
+    # Format each task's label once up front (O(N)); a DAG node rendered
+    # under multiple parents would otherwise re-run the icon lookup and
+    # subject truncation per edge inside the hot loop
+    label_by_id = {
+        t["id"]: (
+            f"#{t['id']} {status_icon(t.get('status', 'pending'))} "
+            f"{t.get('subject', 'Untitled')[:40]}"
+        )
+        for t in tasks
+    }
+    lines: list[str] = []
+    render_tree(label_by_id, tree, lines)
 
-    # Build output box
+    # Build output box in one join; the f-string pads each row in a single
+    # formatting step instead of ljust plus two concatenations
     max_width = max(len(line) for line in lines) if lines else 40
     box_width = max(max_width + 4, 50)
+    inner = box_width - 4
+    hborder = "+" + "-" * (box_width - 2) + "+"
+    blank = "|" + " " * (box_width - 2) + "|"
 
-    output = [
-        "+" + "-" * (box_width - 2) + "+",
-        "|" + " Task Dependency Tree".center(box_width - 2) + "|",
-        "|" + " " * (box_width - 2) + "|",
-    ]
-
-    for line in lines:
-        output.append("|  " + line.ljust(box_width - 4) + "|")
-
-    output.extend(
+    return "\n".join(
         [
-            "|" + " " * (box_width - 2) + "|",
-            "+" + "-" * (box_width - 2) + "+",
+            hborder,
+            "|" + " Task Dependency Tree".center(box_width - 2) + "|",
+            blank,
+            *(f"|  {line:<{inner}}|" for line in lines),
+            blank,
+            hborder,
         ]
     )
 
-    return "\n".join(output)
+
+class _BoxedLineWriter:
+    """Append-only adapter that boxes and writes each line immediately.
+
+    render_tree only ever calls ``append``, so this lets the same DFS
+    drive streaming output without buffering the tree.
+    """
+
+    __slots__ = ("_out", "_inner")
+
+    def __init__(self, out: TextIO, inner: int):
+        self._out = out
+        self._inner = inner
+
+    def append(self, line: str) -> None:
+        self._out.write(f"|  {line:<{self._inner}}|\n")
+
+
+def visualize_stream(task_json: str | bytes, out: TextIO = sys.stdout) -> None:
+    """Stream the boxed tree to ``out`` one line at a time.
+
+    Unlike visualize(), nothing is accumulated: peak memory is O(depth)
+    regardless of tree size and the first row appears as soon as the
+    DFS produces it. Box width comes from the terminal instead of a
+    pre-measuring pass, so very long lines may overrun the right border.
+    """
+    try:
+        tasks, tree = _build_tree_cached(task_json)
+    except ValueError as e:
+        out.write(f"Error parsing JSON: {e}\n")
+        return
+
+    if not tasks:
+        out.write("No tasks to visualize\n")
+        return
+
+    label_by_id = {
+        t["id"]: (
+            f"#{t['id']} {status_icon(t.get('status', 'pending'))} "
+            f"{t.get('subject', 'Untitled')[:40]}"
+        )
+        for t in tasks
+    }
+
+    box_width = max(min(shutil.get_terminal_size().columns, 120), 50)
+    hborder = "+" + "-" * (box_width - 2) + "+"
+    blank = "|" + " " * (box_width - 2) + "|"
+
+    out.write(hborder + "\n")
+    out.write("|" + " Task Dependency Tree".center(box_width - 2) + "|\n")
+    out.write(blank + "\n")
+    render_tree(label_by_id, tree, _BoxedLineWriter(out, box_width - 4))
+    out.write(blank + "\n")
+    out.write(hborder + "\n")
 
 
 def sample_output() -> str:
@@ -160,8 +262,8 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "--sample":
         print(sample_output())
     elif not sys.stdin.isatty():
-        input_json = sys.stdin.read()
-        print(visualize(input_json))
+        # Binary read feeds orjson bytes directly with no decode pass
+        visualize_stream(sys.stdin.buffer.read())
     else:
         print("Usage: echo '<json>' | python task-tree-visualizer.py")
         print("       python task-tree-visualizer.py --sample")
@@ -15,15 +15,30 @@ import logging
 import signal
 import sys
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import timedelta
+from typing import Any
 
 from temporalio import activity, workflow
+from temporalio.api.common.v1 import Payload
 from temporalio.client import Client, TLSConfig
+from temporalio.converter import (
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+    value_to_type,
+)
 from temporalio.worker import Worker
 from temporalio.common import RetryPolicy
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Configuration
@@ -40,6 +55,56 @@ class WorkerConfig:
     tls_key_path: str | None = None
 
 
+# ============================================================================
+# Payload Conversion
+# ============================================================================
+class ORJSONPayloadConverter(JSONPlainPayloadConverter):
+    """json/plain converter that encodes and decodes with orjson.
+
+    Payloads keep the standard json/plain encoding, so workers and
+    clients still using the stdlib converter interoperate; only this
+    process serializes faster. orjson handles dataclasses natively and
+    works on bytes end to end, skipping the str encode/decode round
+    trip on every activity input and result.
+    """
+
+    def to_payload(self, value: Any) -> Payload | None:
+        return Payload(
+            metadata={"encoding": self.encoding.encode()},
+            data=orjson.dumps(value),
+        )
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        obj = orjson.loads(payload.data)
+        if type_hint is not None:
+            obj = value_to_type(type_hint, obj)
+        return obj
+
+
+class _ORJSONCompositeConverter(CompositePayloadConverter):
+    """Default converter chain with the JSON leg swapped for orjson."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            *(
+                ORJSONPayloadConverter()
+                if isinstance(c, JSONPlainPayloadConverter)
+                else c
+                for c in DefaultPayloadConverter.default_encoding_payload_converters
+            )
+        )
+
+
+def make_data_converter() -> DataConverter:
+    """Return the orjson data converter, or the default without orjson."""
+    if orjson is None:
+        return DataConverter.default
+    return replace(
+        DataConverter.default,
+        payload_converter_class=_ORJSONCompositeConverter,
+    )
+
+
 # ============================================================================
 # Activities
 # ============================================================================
@@ -98,6 +163,16 @@ async def create_worker(config: WorkerConfig):
         config.temporal_host,
         namespace=config.namespace,
         tls=tls_config,
+        data_converter=make_data_converter(),
+    )
+
+    # Sync (def) activities run on this executor; sizing it to the
+    # activity concurrency cap means the worker can actually dispatch as
+    # many activities as it polls for, instead of queueing behind a
+    # too-small default pool. Async activities stay on the event loop.
+    activity_executor = ThreadPoolExecutor(
+        max_workers=config.max_concurrent_activities,
+        thread_name_prefix="activity",
     )
 
     # Create worker
@@ -106,6 +181,7 @@ async def create_worker(config: WorkerConfig):
         task_queue=config.task_queue,
         workflows=[ExampleWorkflow],
         activities=[example_activity],
+        activity_executor=activity_executor,
         max_concurrent_activities=config.max_concurrent_activities,
         max_concurrent_workflow_tasks=config.max_concurrent_workflow_tasks,
     )
@@ -113,6 +189,7 @@ async def create_worker(config: WorkerConfig):
     try:
         yield worker
     finally:
+        activity_executor.shutdown(wait=True)
         await client.close()
 
 
@@ -333,10 +333,12 @@ test_import_pattern_in_scripts() {
             [[ "$is_utility" == true ]] && continue
             
             # Check for import pattern - flexible variable names (SCRIPT_DIR, _SCRIPT_DIR, etc.)
-            # Must have: Path(__file__).parent, LIB_DIR reference, and mem0_client import
+            # Must have: Path(__file__).parent, LIB_DIR reference, and a lib client
+            # import: get_mem0_client/get_async_mem0_client directly, or the
+            # mem0_cli decorator (which wraps client creation itself)
             if ! grep -q "Path(__file__).parent" "$script" || \
                ! grep -q "LIB_DIR\|lib" "$script" || \
-               ! grep -q "from mem0_client import get_mem0_client\|from lib.mem0_client import get_mem0_client" "$script"; then
+               ! grep -q "from \(lib\.\)\?mem0_client import get_\(async_\)\?mem0_client\|from \(lib\.\)\?cli import mem0_cli" "$script"; then
                 scripts_missing_pattern+=("$rel_path")
             fi
         fi